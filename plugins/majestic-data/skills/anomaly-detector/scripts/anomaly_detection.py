@@ -5,6 +5,17 @@ Statistical methods (Z-score, IQR, Modified Z-score) and ML-based methods
 (Isolation Forest, LOF) for outlier detection.
 """
 
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+import bisect
+import hashlib
+import json
+import os
+import time
+import warnings
 import pandas as pd
 import numpy as np
 
@@ -58,6 +69,278 @@ def detect_anomalies_modified_zscore(series: pd.Series, threshold: float = 3.5)
     return abs(modified_z) > threshold
 
 
+# =============================================================================
+# Streaming Methods
+# =============================================================================
+
+@dataclass
+class OnlineAnomalyDetector:
+    """Stateful Z-score / Modified Z-score detector for chunked input.
+
+    Mean and std use Welford/Chan running moments, so 'zscore' matches
+    detect_anomalies_zscore over all data seen so far up to floating-point
+    error. 'modified_zscore' takes median and MAD from a uniform reservoir
+    sample: exact while count <= reservoir_size, afterwards the median/MAD
+    rank error is roughly 1/sqrt(reservoir_size) (~1% at the default).
+
+    Args:
+        method: 'zscore' or 'modified_zscore'
+        threshold: Flag threshold (default 3.0 for zscore, 3.5 for modified_zscore)
+        reservoir_size: Sample size backing the streaming median/MAD
+        seed: Seed for reservoir sampling (makes resumed runs reproducible)
+    """
+    method: str = 'zscore'
+    threshold: float | None = None
+    reservoir_size: int = 10_000
+    seed: int = 42
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    reservoir: np.ndarray = field(default_factory=lambda: np.empty(0))
+    _rng: np.random.Generator | None = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self.method not in ('zscore', 'modified_zscore'):
+            raise ValueError(f"Unknown method: {self.method}")
+        if self.threshold is None:
+            self.threshold = 3.0 if self.method == 'zscore' else 3.5
+        if self._rng is None:
+            self._rng = np.random.default_rng(self.seed)
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+    def partial_fit(self, chunk: pd.Series) -> 'OnlineAnomalyDetector':
+        """Fold a chunk into the running state without scoring it."""
+        values = np.asarray(chunk, dtype=float)
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if n == 0:
+            return self
+
+        # Chan et al. pairwise merge of (count, mean, M2)
+        chunk_mean = values.mean()
+        chunk_m2 = ((values - chunk_mean) ** 2).sum()
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += chunk_m2 + delta ** 2 * self.count * n / total
+
+        if self.method == 'modified_zscore':
+            self._update_reservoir(values)
+        self.count = total
+        return self
+
+    def _update_reservoir(self, values: np.ndarray) -> None:
+        # Vectorized Algorithm R: the item with global position i replaces
+        # slot j ~ U[0, i] when j < reservoir_size
+        k = self.reservoir_size
+        free = max(0, min(k - len(self.reservoir), len(values)))
+        if free:
+            self.reservoir = np.concatenate([self.reservoir, values[:free]])
+        rest = values[free:]
+        if len(rest):
+            positions = self.count + free + np.arange(len(rest))
+            slots = self._rng.integers(0, positions + 1)
+            keep = slots < k
+            self.reservoir[slots[keep]] = rest[keep]
+
+    def score(self, chunk: pd.Series) -> pd.Series:
+        """Flag a chunk against the current state without updating it."""
+        if self.method == 'zscore':
+            z_scores = (chunk - self.mean) / self.std
+            return abs(z_scores) > self.threshold
+
+        median = np.median(self.reservoir) if len(self.reservoir) else np.nan
+        mad = np.median(np.abs(self.reservoir - median)) if len(self.reservoir) else np.nan
+        modified_z = 0.6745 * (chunk - median) / mad
+        return abs(modified_z) > self.threshold
+
+    def update(self, chunk: pd.Series) -> pd.Series:
+        """Fold a chunk into the state, then flag it against all data seen so far."""
+        return self.partial_fit(chunk).score(chunk)
+
+    def to_dict(self) -> dict:
+        """Serialize state (JSON-compatible) so a job can resume later."""
+        return {
+            'method': self.method,
+            'threshold': self.threshold,
+            'reservoir_size': self.reservoir_size,
+            'seed': self.seed,
+            'count': self.count,
+            'mean': self.mean,
+            'm2': self.m2,
+            'reservoir': self.reservoir.tolist(),
+            'rng_state': self._rng.bit_generator.state,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> 'OnlineAnomalyDetector':
+        """Restore a detector serialized with to_dict."""
+        detector = cls(
+            method=state['method'],
+            threshold=state['threshold'],
+            reservoir_size=state['reservoir_size'],
+            seed=state['seed'],
+            count=state['count'],
+            mean=state['mean'],
+            m2=state['m2'],
+            reservoir=np.asarray(state['reservoir'], dtype=float),
+        )
+        detector._rng.bit_generator.state = state['rng_state']
+        return detector
+
+
+@dataclass
+class QuantileSketch:
+    """Mergeable KLL quantile sketch with bounded memory.
+
+    Holds O(k log(n/k)) values regardless of input size. Quantiles are exact
+    (linear interpolation, like Series.quantile) until the first compaction;
+    afterwards the typical rank error is ~0.5% at k=200 (worst case ~1-2%)
+    and ~0.1% at k=1000. Sketches built on separate partitions or workers
+    combine with merge().
+
+    Args:
+        k: Accuracy parameter (capacity of the top compactor)
+        seed: Seed for compaction coin flips
+    """
+    k: int = 200
+    seed: int = 42
+    count: int = 0
+    levels: list[np.ndarray] = field(default_factory=list)
+    _rng: np.random.Generator | None = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self._rng is None:
+            self._rng = np.random.default_rng(self.seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                odd = len(items) % 2
+                offset = self._rng.integers(2)
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], items[odd + offset::2]])
+                self.levels[level] = items[:odd]
+            level += 1
+
+    def update(self, values: pd.Series | np.ndarray) -> 'QuantileSketch':
+        """Add a chunk of values (NaN ignored)."""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        if not self.levels:
+            self.levels = [np.empty(0)]
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._compress()
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Fold another sketch into this one (in place)."""
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-th quantile of all values seen."""
+        if self.count == 0:
+            return np.nan
+        if len(self.levels) == 1:
+            return float(np.quantile(self.levels[0], q))
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(lv), 2 ** h) for h, lv in enumerate(self.levels)])
+        order = np.argsort(items)
+        cum_weights = np.cumsum(weights[order])
+        idx = np.searchsorted(cum_weights, q * cum_weights[-1])
+        return float(items[order][min(idx, len(items) - 1)])
+
+    def iqr_bounds(self, multiplier: float = 1.5) -> tuple[float, float]:
+        """Lower/upper fences as in detect_anomalies_iqr."""
+        Q1 = self.quantile(0.25)
+        Q3 = self.quantile(0.75)
+        IQR = Q3 - Q1
+        return Q1 - multiplier * IQR, Q3 + multiplier * IQR
+
+    def to_dict(self) -> dict:
+        """Serialize sketch (JSON-compatible) for shipping between workers."""
+        return {
+            'k': self.k,
+            'seed': self.seed,
+            'count': self.count,
+            'levels': [lv.tolist() for lv in self.levels],
+            'rng_state': self._rng.bit_generator.state,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> 'QuantileSketch':
+        """Restore a sketch serialized with to_dict."""
+        sketch = cls(
+            k=state['k'],
+            seed=state['seed'],
+            count=state['count'],
+            levels=[np.asarray(lv, dtype=float) for lv in state['levels']],
+        )
+        sketch._rng.bit_generator.state = state['rng_state']
+        return sketch
+
+
+def iter_parquet_column(
+    path: str,
+    column: str,
+    batch_size: int = 1_000_000
+) -> Iterator[pd.Series]:
+    """Stream one column of a Parquet file or partitioned dataset in batches.
+
+    Yields Series indexed by global row position, so masks from successive
+    passes over the same dataset line up.
+    """
+    import pyarrow.dataset as ds
+
+    offset = 0
+    for batch in ds.dataset(path, format='parquet').to_batches(columns=[column], batch_size=batch_size):
+        series = batch.column(0).to_pandas()
+        series.index = pd.RangeIndex(offset, offset + len(series))
+        offset += len(series)
+        yield series
+
+
+def detect_anomalies_iqr_sketch(
+    chunks: Iterable[pd.Series],
+    sketch: QuantileSketch,
+    multiplier: float = 1.5
+) -> Iterator[pd.Series]:
+    """Second pass of sketch-based IQR detection: flag chunks against sketch fences.
+
+    Args:
+        chunks: Iterable of numeric Series (e.g. from iter_parquet_column)
+        sketch: QuantileSketch built (and merged) over the full dataset
+        multiplier: IQR multiplier (1.5 for outliers, 3.0 for extreme outliers)
+
+    Yields:
+        Boolean Series per chunk where True indicates anomaly
+    """
+    lower, upper = sketch.iqr_bounds(multiplier)
+    for chunk in chunks:
+        yield (chunk < lower) | (chunk > upper)
+
+
 # =============================================================================
 # ML-Based Methods
 # =============================================================================
@@ -77,11 +360,15 @@ def detect_anomalies_isolation_forest(
     Returns:
         Boolean Series where True indicates anomaly
     """
+    flags = _isolation_forest_flags(df[columns].fillna(0).to_numpy(), contamination)
+    return pd.Series(flags, index=df.index)
+
+
+def _isolation_forest_flags(features: np.ndarray, contamination: float = 0.01) -> np.ndarray:
     from sklearn.ensemble import IsolationForest
 
     model = IsolationForest(contamination=contamination, random_state=42)
-    predictions = model.fit_predict(df[columns].fillna(0))
-    return pd.Series(predictions == -1, index=df.index)
+    return model.fit_predict(features) == -1
 
 
 def detect_anomalies_lof(
@@ -101,6 +388,233 @@ def detect_anomalies_lof(
     return pd.Series(predictions == -1, index=df.index)
 
 
+def detect_anomalies_lof_scalable(
+    df: pd.DataFrame,
+    columns: list[str],
+    n_neighbors: int = 20,
+    contamination: float = 0.01,
+    sample_size: int = 50_000,
+    stratify_by: str | None = None,
+    chunk_size: int = 100_000,
+    algorithm: str = 'kd_tree',
+    random_state: int = 42
+) -> pd.Series:
+    """Large-data LOF: fit on a subsample, score all rows in chunks.
+
+    Fits LocalOutlierFactor(novelty=True) on at most sample_size rows using a
+    tree neighbour index, then scores df in chunk_size slices so memory stays
+    O(sample_size + chunk_size * n_neighbors) instead of exact all-pairs k-NN.
+    Falls back to detect_anomalies_lof when df fits in one sample.
+
+    Args:
+        df: DataFrame with data
+        columns: Columns to use for detection
+        n_neighbors: Neighbours for local density
+        contamination: Expected proportion of outliers
+        sample_size: Rows used to build the neighbour index
+        stratify_by: Optional column to sample proportionally within (e.g. segment)
+        chunk_size: Rows scored per predict call
+        algorithm: sklearn neighbour index ('kd_tree', 'ball_tree')
+        random_state: Seed for subsampling
+
+    Returns:
+        Boolean Series where True indicates anomaly
+    """
+    from sklearn.neighbors import LocalOutlierFactor
+
+    if len(df) <= sample_size:
+        return detect_anomalies_lof(df, columns, n_neighbors, contamination)
+
+    if stratify_by is None:
+        sample = df.sample(n=sample_size, random_state=random_state)
+    else:
+        frac = sample_size / len(df)
+        sample = df.groupby(stratify_by, group_keys=False).sample(frac=frac, random_state=random_state)
+
+    model = LocalOutlierFactor(
+        n_neighbors=n_neighbors,
+        contamination=contamination,
+        novelty=True,
+        algorithm=algorithm
+    )
+    model.fit(sample[columns].fillna(0).to_numpy())
+
+    flags = np.empty(len(df), dtype=bool)
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size][columns].fillna(0).to_numpy()
+        flags[start:start + chunk_size] = model.predict(chunk) == -1
+    return pd.Series(flags, index=df.index)
+
+
+# =============================================================================
+# Model Cache (fit once, score many)
+# =============================================================================
+
+MODEL_CACHE_VERSION = 1
+
+_MODEL_DEFAULTS = {
+    'isolation_forest': {'contamination': 0.01, 'random_state': 42},
+    'lof': {'n_neighbors': 20, 'contamination': 0.01},
+}
+
+
+def data_fingerprint(df: pd.DataFrame, columns: list[str]) -> str:
+    """Content hash of df[columns] (values and column order, not the index)."""
+    row_hashes = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+    digest = hashlib.sha256(row_hashes.tobytes())
+    digest.update(json.dumps(columns).encode())
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class FittedDetector:
+    """A fitted Isolation Forest / LOF (novelty) model plus its cache key parts."""
+    method: str
+    columns: list[str]
+    params: dict
+    fingerprint: str
+    model: object
+
+    def _features(self, df: pd.DataFrame) -> np.ndarray:
+        return df[self.columns].fillna(0).to_numpy()
+
+    def predict(self, df: pd.DataFrame) -> pd.Series:
+        """Boolean Series where True indicates anomaly."""
+        return pd.Series(self.model.predict(self._features(df)) == -1, index=df.index)
+
+    def decision_function(self, df: pd.DataFrame) -> pd.Series:
+        """Anomaly scores (lower is more anomalous, negative means outlier)."""
+        return pd.Series(self.model.decision_function(self._features(df)), index=df.index)
+
+
+class AnomalyModelCache:
+    """On-disk cache of fitted detectors keyed by method, columns, params and data.
+
+    Entries are stored as '<key>.joblib' (the sklearn model) plus a
+    '<key>.json' metadata sidecar.
+    Entries written under a different MODEL_CACHE_VERSION or scikit-learn
+    version are discarded on read. The least recently used entries are
+    evicted beyond max_entries.
+
+    LOF is fitted with novelty=True so it can score unseen rows; its flags on
+    the training data itself differ from detect_anomalies_lof's fit_predict.
+    """
+
+    def __init__(self, cache_dir: str | Path, max_entries: int = 16):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+    @staticmethod
+    def _resolve_params(method: str, params: dict) -> dict:
+        if method not in _MODEL_DEFAULTS:
+            raise ValueError(f"Unknown method: {method}")
+        return {**_MODEL_DEFAULTS[method], **params}
+
+    @staticmethod
+    def _key(method: str, columns: list[str], params: dict, fingerprint: str) -> str:
+        payload = json.dumps([MODEL_CACHE_VERSION, method, columns, params, fingerprint], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+    @staticmethod
+    def _sklearn_version() -> str:
+        import sklearn
+        return sklearn.__version__
+
+    def _read(self, key: str) -> FittedDetector | None:
+        import joblib
+
+        meta_path = self.cache_dir / f'{key}.json'
+        if not meta_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text())
+        if meta['cache_version'] != MODEL_CACHE_VERSION or meta['sklearn_version'] != self._sklearn_version():
+            self._remove(key)
+            return None
+        model = joblib.load(self.cache_dir / f'{key}.joblib')
+        os.utime(meta_path)  # mark as recently used
+        return FittedDetector(meta['method'], meta['columns'], meta['params'], meta['fingerprint'], model)
+
+    def _write(self, key: str, detector: FittedDetector) -> None:
+        import joblib
+
+        # Only the sklearn model is pickled; the wrapper is rebuilt from metadata
+        joblib.dump(detector.model, self.cache_dir / f'{key}.joblib')
+        meta = {
+            'cache_version': MODEL_CACHE_VERSION,
+            'sklearn_version': self._sklearn_version(),
+            'method': detector.method,
+            'columns': detector.columns,
+            'params': detector.params,
+            'fingerprint': detector.fingerprint,
+            'created': datetime.now().isoformat(),
+        }
+        (self.cache_dir / f'{key}.json').write_text(json.dumps(meta))
+        self._evict()
+
+    def _remove(self, key: str) -> None:
+        for suffix in ('.json', '.joblib'):
+            (self.cache_dir / f'{key}{suffix}').unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        entries = sorted(self.cache_dir.glob('*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
+        for meta_path in entries[self.max_entries:]:
+            self._remove(meta_path.stem)
+
+    def fit(
+        self,
+        df: pd.DataFrame,
+        columns: list[str],
+        method: str = 'isolation_forest',
+        **params
+    ) -> FittedDetector:
+        """Return the cached detector for this training data, fitting it if missing.
+
+        Args:
+            df: Training data
+            columns: Feature columns
+            method: 'isolation_forest' or 'lof'
+            **params: Model parameters (contamination, n_neighbors, random_state, ...)
+        """
+        params = self._resolve_params(method, params)
+        fingerprint = data_fingerprint(df, columns)
+        key = self._key(method, columns, params, fingerprint)
+
+        detector = self._read(key)
+        if detector is not None:
+            return detector
+
+        if method == 'isolation_forest':
+            from sklearn.ensemble import IsolationForest
+            model = IsolationForest(**params)
+        else:
+            from sklearn.neighbors import LocalOutlierFactor
+            model = LocalOutlierFactor(novelty=True, **params)
+        detector = FittedDetector(method, list(columns), params, fingerprint, model)
+        model.fit(detector._features(df))
+        self._write(key, detector)
+        return detector
+
+    def latest(self, columns: list[str], method: str = 'isolation_forest', **params) -> FittedDetector | None:
+        """Most recently fitted detector for these columns/params, without training data."""
+        params = self._resolve_params(method, params)
+        candidates = []
+        for meta_path in self.cache_dir.glob('*.json'):
+            meta = json.loads(meta_path.read_text())
+            if (meta['method'], meta['columns'], meta['params']) == (method, list(columns), params):
+                candidates.append((meta['created'], meta_path.stem))
+        for _, key in sorted(candidates, reverse=True):
+            detector = self._read(key)
+            if detector is not None:
+                return detector
+        return None
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        for meta_path in self.cache_dir.glob('*.json'):
+            self._remove(meta_path.stem)
+
+
 # =============================================================================
 # Time-Series Methods
 # =============================================================================
@@ -123,6 +637,159 @@ def detect_anomalies_rolling(
     return (series < lower) | (series > upper)
 
 
+def detect_anomalies_rolling_grouped(
+    df: pd.DataFrame,
+    value_col: str,
+    group_col: str | list[str],
+    window: int = 7,
+    n_std: float = 2.0
+) -> pd.Series:
+    """Per-segment detect_anomalies_rolling in one vectorized pass.
+
+    Uses pandas' groupby-rolling, which computes every group's centered
+    windows in a single Cython pass instead of one rolling call per segment.
+    Rows must already be in time order within each group (as for the
+    single-series function); windows never cross group boundaries.
+
+    Args:
+        df: Long-format DataFrame
+        value_col: Metric column
+        group_col: Segment key column(s), e.g. 'customer_id' or ['sku', 'store']
+        window: Rolling window size
+        n_std: Number of standard deviations for the bounds
+
+    Returns:
+        Boolean Series aligned to df.index where True indicates anomaly
+    """
+    values = pd.Series(df[value_col].to_numpy(), index=pd.RangeIndex(len(df)))
+    keys = [df[col].to_numpy() for col in ([group_col] if isinstance(group_col, str) else group_col)]
+    rolling = values.groupby(keys, sort=False).rolling(window=window, center=True)
+
+    rolling_mean = rolling.mean()
+    rolling_std = rolling.std()
+    positions = rolling_mean.index.get_level_values(-1)
+    current = values.to_numpy()[positions]
+
+    lower = rolling_mean.to_numpy() - n_std * rolling_std.to_numpy()
+    upper = rolling_mean.to_numpy() + n_std * rolling_std.to_numpy()
+
+    flags = np.zeros(len(df), dtype=bool)
+    flags[positions] = (current < lower) | (current > upper)
+    return pd.Series(flags, index=df.index)
+
+
+def _kth_of_two(left: Callable[[int], float], right: Callable[[int], float],
+                n_left: int, n_right: int, k: int) -> float:
+    """k-th smallest (0-based) of two ascending sequences, in O(log n)."""
+    lo, hi = max(0, k + 1 - n_right), min(k + 1, n_left)
+    while lo < hi:
+        i = (lo + hi) // 2
+        if left(i) < right(k - i):
+            lo = i + 1
+        else:
+            hi = i
+    j = k + 1 - lo
+    if lo == 0:
+        return right(j - 1)
+    if j == 0:
+        return left(lo - 1)
+    return max(left(lo - 1), right(j - 1))
+
+
+@dataclass
+class RollingMADDetector:
+    """Incremental centered rolling Modified Z-score (rolling median + MAD).
+
+    Keeps the current window as a sorted list plus an arrival deque, so each
+    new point costs one insort/removal and an O(log window) MAD selection
+    instead of re-sorting the window. A point is scored once the window
+    centered on it is complete (window // 2 points of lag), matching
+    Series.rolling(window, center=True) alignment; windows containing NaN
+    are not scored.
+
+    Args:
+        window: Rolling window size
+        threshold: Modified Z-score threshold
+    """
+    window: int = 7
+    threshold: float = 3.5
+    _arrivals: deque = field(default_factory=deque, repr=False)
+    _sorted: list = field(default_factory=list, repr=False)
+    _nan_count: int = 0
+
+    def _push(self, label, value: float) -> None:
+        self._arrivals.append((label, value))
+        if np.isnan(value):
+            self._nan_count += 1
+        else:
+            bisect.insort(self._sorted, value)
+
+        if len(self._arrivals) > self.window:
+            _, old = self._arrivals.popleft()
+            if np.isnan(old):
+                self._nan_count -= 1
+            else:
+                del self._sorted[bisect.bisect_left(self._sorted, old)]
+
+    def _median_mad(self) -> tuple[float, float]:
+        values, n = self._sorted, len(self._sorted)
+        median = (values[(n - 1) // 2] + values[n // 2]) / 2
+        split = bisect.bisect_left(values, median)
+
+        def below(t: int) -> float:
+            return median - values[split - 1 - t]
+
+        def above(t: int) -> float:
+            return values[split + t] - median
+
+        lo = _kth_of_two(below, above, split, n - split, (n - 1) // 2)
+        hi = lo if n % 2 else _kth_of_two(below, above, split, n - split, n // 2)
+        return median, (lo + hi) / 2
+
+    def update(self, values: pd.Series) -> pd.Series:
+        """Feed new points; return flags for points whose window just completed.
+
+        Returns:
+            Boolean Series indexed by the labels of the newly scored points
+        """
+        labels, flags = [], []
+        center = self.window // 2
+        for label, value in zip(values.index, values.to_numpy(dtype=float)):
+            self._push(label, value)
+            if len(self._arrivals) < self.window:
+                continue
+            center_label, center_value = self._arrivals[center]
+            labels.append(center_label)
+            if self._nan_count:
+                flags.append(False)
+                continue
+            median, mad = self._median_mad()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                modified_z = 0.6745 * (center_value - median) / np.float64(mad)
+            flags.append(bool(abs(modified_z) > self.threshold))
+        return pd.Series(flags, index=pd.Index(labels, dtype=values.index.dtype), dtype=bool)
+
+
+def detect_anomalies_rolling_mad(
+    series: pd.Series,
+    window: int = 7,
+    threshold: float = 3.5
+) -> pd.Series:
+    """Detect anomalies using a centered rolling median/MAD (robust rolling).
+
+    Robust counterpart to detect_anomalies_rolling; edges without a full
+    window are not flagged. For live streams keep a RollingMADDetector and
+    call update() with each new batch instead.
+    """
+    flags = RollingMADDetector(window=window, threshold=threshold).update(series)
+    # Scored points are consecutive from position window // 2; place them by
+    # position so duplicate index labels are fine
+    mask = np.zeros(len(series), dtype=bool)
+    start = window // 2
+    mask[start:start + len(flags)] = flags.to_numpy()
+    return pd.Series(mask, index=series.index)
+
+
 def detect_anomalies_stl(
     series: pd.Series,
     period: int,
@@ -145,44 +812,265 @@ def detect_anomalies_stl(
     return abs(z_scores) > threshold
 
 
+def _stl_group_task(task: tuple) -> np.ndarray:
+    values, period, threshold = task
+    return detect_anomalies_stl(pd.Series(values), period, threshold).to_numpy()
+
+
+def detect_anomalies_stl_grouped(
+    df: pd.DataFrame,
+    value_col: str,
+    entity_col: str,
+    timestamp_col: str,
+    period: int,
+    threshold: float = 3.0,
+    max_workers: int | None = None,
+    chunksize: int = 32
+) -> tuple[pd.Series, list[dict]]:
+    """Run STL detection per entity over a long-format frame in a process pool.
+
+    Rows are ordered by (entity, timestamp) with one lexsort; each entity's
+    values are dispatched to workers in batches of `chunksize` groups.
+
+    Args:
+        df: Long-format DataFrame (one row per entity and timestamp)
+        value_col: Metric column
+        entity_col: Column identifying each series
+        timestamp_col: Column to order each series by
+        period: Seasonal period
+        threshold: Residual Z-score threshold
+        max_workers: Process pool size (None = CPU count, 1 = run in-process)
+        chunksize: Groups per task sent to a worker
+
+    Returns:
+        Tuple of (boolean Series aligned to df.index, list of skipped groups as
+        {'entity', 'rows', 'reason'} dicts for series shorter than 2 * period)
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    codes, entities = pd.factorize(df[entity_col], use_na_sentinel=False)
+    order = np.lexsort((df[timestamp_col].to_numpy(), codes))
+    boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+    values = df[value_col].to_numpy(dtype=float)
+
+    group_positions, tasks, skipped = [], [], []
+    for positions in np.split(order, boundaries):
+        if len(positions) == 0:
+            continue
+        if len(positions) < 2 * period:
+            skipped.append({
+                'entity': entities[codes[positions[0]]],
+                'rows': len(positions),
+                'reason': f'fewer than 2 * period ({2 * period}) rows'
+            })
+            continue
+        group_positions.append(positions)
+        tasks.append((values[positions], period, threshold))
+
+    if max_workers == 1:
+        results = list(map(_stl_group_task, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_stl_group_task, tasks, chunksize=chunksize))
+
+    mask = np.zeros(len(df), dtype=bool)
+    for positions, flags in zip(group_positions, results):
+        mask[positions] = flags
+
+    return pd.Series(mask, index=df.index), skipped
+
+
 # =============================================================================
 # Ensemble Approach
 # =============================================================================
 
+def _column_quartiles(X: np.ndarray, missing: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Q1, median and Q3 per column, bitwise-equal to Series.quantile/median.
+
+    NaN-free columns share one np.partition call for all three statistics;
+    columns with NaN fall back to the nan-aware NumPy reductions.
+    """
+    q1, median, q3 = (np.full(X.shape[1], np.nan) for _ in range(3))
+    has_nan = missing.any(axis=0)
+    dense = np.flatnonzero(~has_nan)
+    n = X.shape[0]
+
+    if len(dense) and n:
+        # numpy 'linear' quantile: virtual index, then lerp between neighbours
+        virtual = {q: n * q + (1 + q * -1) - 1 for q in (0.25, 0.75)}
+        lo = {q: int(np.floor(v)) for q, v in virtual.items()}
+        hi = {q: min(lo[q] + 1, n - 1) for q in lo}
+        mid = [(n - 1) // 2, n // 2]
+        kth = sorted(set(lo.values()) | set(hi.values()) | set(mid))
+        part = np.partition(X[:, dense], kth, axis=0)
+
+        for q, out in ((0.25, q1), (0.75, q3)):
+            a, b = part[lo[q]], part[hi[q]]
+            gamma = virtual[q] - lo[q]
+            diff = b - a
+            out[dense] = b - diff * (1 - gamma) if gamma >= 0.5 else a + diff * gamma
+        median[dense] = (part[mid[0]] + part[mid[1]]) / 2
+
+    sparse = np.flatnonzero(has_nan)
+    if len(sparse):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            q1[sparse], q3[sparse] = np.nanquantile(X[:, sparse], [0.25, 0.75], axis=0)
+            median[sparse] = np.nanmedian(X[:, sparse], axis=0)
+
+    return q1, median, q3
+
+
+def _zscore_flags(X: np.ndarray, missing: np.ndarray, threshold: float) -> np.ndarray:
+    count = (~missing).sum(axis=0)
+    filled = np.where(missing, 0.0, X)
+    mean = filled.sum(axis=0) / count
+    sq_dev = np.where(missing, 0.0, (mean - X) ** 2)
+    std = np.sqrt(sq_dev.sum(axis=0) / (count - 1))
+    return np.abs((X - mean) / std) > threshold
+
+
+def _iqr_flags(X: np.ndarray, q1: np.ndarray, q3: np.ndarray, multiplier: float) -> np.ndarray:
+    iqr = q3 - q1
+    return (X < q1 - multiplier * iqr) | (X > q3 + multiplier * iqr)
+
+
+def _mzscore_flags(X: np.ndarray, missing: np.ndarray, median: np.ndarray, threshold: float) -> np.ndarray:
+    mad = _column_quartiles(np.abs(X - median), missing)[1]
+    return np.abs(0.6745 * (X - median) / mad) > threshold
+
+
+def _flag_frame(flags: dict, columns: list[str], index: pd.Index) -> pd.DataFrame:
+    data = {
+        f'{col}_{name}': flags[name][:, i]
+        for i, col in enumerate(columns)
+        for name in ('zscore', 'iqr', 'mzscore') if name in flags
+    }
+    return pd.DataFrame(data, index=index)
+
+
+def detect_anomalies_matrix(
+    df: pd.DataFrame,
+    columns: list[str],
+    methods: list[str] = ['zscore', 'iqr', 'modified_zscore'],
+    zscore_threshold: float = 3.0,
+    iqr_multiplier: float = 1.5,
+    mzscore_threshold: float = 3.5
+) -> pd.DataFrame:
+    """Run the statistical detectors on every column in one NumPy pass.
+
+    Equivalent to calling detect_anomalies_zscore / _iqr / _modified_zscore
+    per column, but reductions run column-wise over a single column-major
+    float64 array and the result frame is built once.
+
+    Args:
+        df: DataFrame with data
+        columns: Numeric columns to analyze
+        methods: Any of 'zscore', 'iqr', 'modified_zscore'
+        zscore_threshold: Z-score threshold
+        iqr_multiplier: IQR multiplier
+        mzscore_threshold: Modified Z-score threshold
+
+    Returns:
+        DataFrame with one boolean column per (column, method), named like
+        detect_anomalies_ensemble ('{col}_zscore', '{col}_iqr', '{col}_mzscore')
+    """
+    # Column-major so each column's reduction is a contiguous (pairwise) sum,
+    # matching pandas' per-Series results
+    X = np.asfortranarray(df[columns].to_numpy(dtype=np.float64))
+    missing = np.isnan(X)
+    flags = {}
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if 'zscore' in methods:
+            flags['zscore'] = _zscore_flags(X, missing, zscore_threshold)
+
+        if 'iqr' in methods or 'modified_zscore' in methods:
+            q1, median, q3 = _column_quartiles(X, missing)
+
+        if 'iqr' in methods:
+            flags['iqr'] = _iqr_flags(X, q1, q3, iqr_multiplier)
+
+        if 'modified_zscore' in methods:
+            flags['mzscore'] = _mzscore_flags(X, missing, median, mzscore_threshold)
+
+    return _flag_frame(flags, columns, df.index)
+
+
+def _timed(fn: Callable) -> tuple[object, float]:
+    # np.errstate is thread-local, so enter it in the thread that runs fn
+    with np.errstate(divide='ignore', invalid='ignore'):
+        start = time.perf_counter()
+        result = fn()
+        return result, time.perf_counter() - start
+
+
 def detect_anomalies_ensemble(
     df: pd.DataFrame,
     columns: list[str],
     methods: list[str] = ['zscore', 'iqr', 'isolation_forest'],
-    min_agreement: int = 2
+    min_agreement: int = 2,
+    max_workers: int = 1,
+    dtype: type = np.float64
 ) -> pd.DataFrame:
     """Combine multiple anomaly detection methods.
 
+    The feature matrix is extracted once (column-major, NaN mask computed
+    once) and shared by every method. With max_workers > 1 the methods run
+    concurrently in a thread pool; NumPy reductions and the Isolation Forest
+    release the GIL, and threads share the matrix without copying it.
+
     Args:
         df: DataFrame with data
         columns: Columns to analyze
         methods: List of methods to use
         min_agreement: Minimum methods that must agree for flagging
+        max_workers: Threads for concurrent method execution (1 = sequential)
+        dtype: Feature matrix dtype; np.float32 halves memory, but statistical
+            flags may then differ from float64 results at the margins
 
     Returns:
-        DataFrame with anomaly flags per method and combined
+        DataFrame with anomaly flags per method and combined. Per-stage
+        wall-clock seconds are in results.attrs['timings'].
     """
-    results = pd.DataFrame(index=df.index)
+    from concurrent.futures import ThreadPoolExecutor
 
-    for col in columns:
-        series = df[col]
+    timings = {}
+    start = time.perf_counter()
+    X = np.asfortranarray(df[columns].to_numpy(dtype=dtype))
+    missing = np.isnan(X)
+    timings['prepare'] = time.perf_counter() - start
 
-        if 'zscore' in methods:
-            results[f'{col}_zscore'] = detect_anomalies_zscore(series)
-        if 'iqr' in methods:
-            results[f'{col}_iqr'] = detect_anomalies_iqr(series)
-        if 'modified_zscore' in methods:
-            results[f'{col}_mzscore'] = detect_anomalies_modified_zscore(series)
+    if 'iqr' in methods or 'modified_zscore' in methods:
+        (q1, median, q3), timings['quartiles'] = _timed(lambda: _column_quartiles(X, missing))
 
+    tasks = {}
+    if 'zscore' in methods:
+        tasks['zscore'] = lambda: _zscore_flags(X, missing, 3.0)
+    if 'iqr' in methods:
+        tasks['iqr'] = lambda: _iqr_flags(X, q1, q3, 1.5)
+    if 'modified_zscore' in methods:
+        tasks['mzscore'] = lambda: _mzscore_flags(X, missing, median, 3.5)
     if 'isolation_forest' in methods:
-        results['isolation_forest'] = detect_anomalies_isolation_forest(df, columns)
+        tasks['isolation_forest'] = lambda: _isolation_forest_flags(np.where(missing, 0, X))
+
+    if max_workers == 1:
+        outputs = {name: _timed(fn) for name, fn in tasks.items()}
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {name: pool.submit(_timed, fn) for name, fn in tasks.items()}
+            outputs = {name: future.result() for name, future in futures.items()}
+
+    flags = {name: result for name, (result, _) in outputs.items()}
+    timings.update({name: seconds for name, (_, seconds) in outputs.items()})
+
+    results = _flag_frame(flags, columns, df.index)
+    if 'isolation_forest' in flags:
+        results['isolation_forest'] = flags['isolation_forest']
 
     # Combined flag: anomaly if min_agreement methods agree
     method_cols = list(results.columns)
     results['is_anomaly'] = results[method_cols].sum(axis=1) >= min_agreement
 
+    results.attrs['timings'] = {name: round(seconds, 6) for name, seconds in timings.items()}
     return results
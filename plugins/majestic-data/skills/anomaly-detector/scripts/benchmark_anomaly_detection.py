@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for anomaly_detection.py.
+
+Usage:
+    python benchmark_anomaly_detection.py detectors [--rows N ...] [--cols N ...] [--detectors NAME ...] [--output FILE]
+    python benchmark_anomaly_detection.py lof [--rows N ...] [--exact-max-rows N] [--output FILE]
+    python benchmark_anomaly_detection.py compare BASELINE CURRENT [--tolerance PCT]
+
+Examples:
+    python benchmark_anomaly_detection.py detectors
+    python benchmark_anomaly_detection.py detectors --rows 10000 100000 --cols 1 20 --output v2.jsonl
+    python benchmark_anomaly_detection.py lof --rows 100000 1000000 10000000 --output lof.jsonl
+    python benchmark_anomaly_detection.py compare v1.jsonl v2.jsonl --tolerance 20
+
+Each run appends one JSON object per measurement to --output (JSON lines),
+tagged with a run id, library versions and the generator seed.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from anomaly_detection import (
+    OnlineAnomalyDetector,
+    QuantileSketch,
+    detect_anomalies_zscore,
+    detect_anomalies_iqr,
+    detect_anomalies_iqr_sketch,
+    detect_anomalies_modified_zscore,
+    detect_anomalies_isolation_forest,
+    detect_anomalies_lof,
+    detect_anomalies_lof_scalable,
+    detect_anomalies_rolling,
+    detect_anomalies_rolling_grouped,
+    detect_anomalies_rolling_mad,
+    detect_anomalies_stl,
+    detect_anomalies_stl_grouped,
+    detect_anomalies_matrix,
+    detect_anomalies_ensemble,
+)
+
+
+# =============================================================================
+# Synthetic Data
+# =============================================================================
+
+def make_time_series(
+    n_rows: int,
+    n_cols: int = 1,
+    anomaly_rate: float = 0.01,
+    period: int = 24,
+    trend: float = 20.0,
+    seed: int = 0
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """Trend + seasonality + noise per column, with injected spike anomalies.
+
+    Each column drifts by `trend` over the whole series, has a seasonal
+    amplitude of 10 and unit noise; spikes add 20-40 in either direction.
+
+    Returns:
+        Tuple of (DataFrame with columns m0..mN, boolean ground truth of shape
+        (n_rows, n_cols))
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_rows)[:, None]
+    phase = rng.uniform(0, 2 * np.pi, n_cols)
+    level = rng.uniform(50, 150, n_cols)
+    X = level + trend * t / n_rows + 10 * np.sin(2 * np.pi * t / period + phase) + rng.normal(size=(n_rows, n_cols))
+
+    truth = rng.random((n_rows, n_cols)) < anomaly_rate
+    spikes = rng.choice([-1, 1], size=truth.sum()) * rng.uniform(20, 40, truth.sum())
+    X[truth] += spikes
+
+    columns = [f'm{i}' for i in range(n_cols)]
+    return pd.DataFrame(X, columns=columns), truth
+
+
+def make_blobs_with_outliers(
+    n_rows: int,
+    n_cols: int = 3,
+    anomaly_rate: float = 0.01,
+    seed: int = 0
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """Gaussian clusters plus uniformly scattered outliers.
+
+    Returns:
+        Tuple of (DataFrame with columns x0..xN, boolean ground-truth array)
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-10, 10, size=(5, n_cols))
+    X = centers[rng.integers(0, len(centers), n_rows)] + rng.normal(size=(n_rows, n_cols))
+
+    is_anomaly = rng.random(n_rows) < anomaly_rate
+    X[is_anomaly] = rng.uniform(-25, 25, size=(is_anomaly.sum(), n_cols))
+
+    columns = [f'x{i}' for i in range(n_cols)]
+    return pd.DataFrame(X, columns=columns), is_anomaly
+
+
+# =============================================================================
+# Detector Registry
+# =============================================================================
+
+# Rows per chunk for the streaming detectors
+STREAM_CHUNK_ROWS = 10_000
+
+
+def _chunks(series: pd.Series) -> list[pd.Series]:
+    return [series.iloc[i:i + STREAM_CHUNK_ROWS] for i in range(0, len(series), STREAM_CHUNK_ROWS)]
+
+
+def _online(series: pd.Series, method: str) -> pd.Series:
+    """OnlineAnomalyDetector.update over fixed-size chunks, as a streaming job would."""
+    detector = OnlineAnomalyDetector(method=method)
+    return pd.concat([detector.update(chunk) for chunk in _chunks(series)])
+
+
+def _iqr_sketch(series: pd.Series) -> pd.Series:
+    """Two passes: build a QuantileSketch over the chunks, then flag each chunk."""
+    sketch = QuantileSketch()
+    for chunk in _chunks(series):
+        sketch.update(chunk)
+    return pd.concat(list(detect_anomalies_iqr_sketch(_chunks(series), sketch)))
+
+
+def _grouped(detect: Callable[[pd.DataFrame], pd.Series]) -> Callable[[pd.DataFrame, list[str]], pd.DataFrame]:
+    """Run a long-format grouped detector with one entity per column of the wide frame."""
+    def run(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
+        n_rows = len(df)
+        long = pd.DataFrame({
+            'entity': np.repeat(np.arange(len(cols)), n_rows),
+            'timestamp': np.tile(np.arange(n_rows), len(cols)),
+            'value': df[cols].to_numpy().T.ravel(),
+        })
+        flags = detect(long).to_numpy().reshape(len(cols), n_rows).T
+        return pd.DataFrame(flags, columns=cols, index=df.index)
+    return run
+
+
+# Series detectors run once per column and yield a (rows, cols) mask; frame
+# detectors see all columns at once and yield a per-row mask (or one flag
+# column per input column).
+SERIES_DETECTORS: dict[str, Callable[[pd.Series], pd.Series]] = {
+    'zscore': detect_anomalies_zscore,
+    'iqr': detect_anomalies_iqr,
+    'modified_zscore': detect_anomalies_modified_zscore,
+    'rolling': lambda s: detect_anomalies_rolling(s, window=7),
+    'rolling_mad': lambda s: detect_anomalies_rolling_mad(s, window=7),
+    'stl': lambda s: detect_anomalies_stl(s, period=24),
+    'online_zscore': lambda s: _online(s, 'zscore'),
+    'online_modified_zscore': lambda s: _online(s, 'modified_zscore'),
+    'iqr_sketch': _iqr_sketch,
+}
+
+FRAME_DETECTORS: dict[str, Callable[[pd.DataFrame, list[str]], pd.Series | pd.DataFrame]] = {
+    'matrix': lambda df, cols: detect_anomalies_matrix(df, cols),
+    'isolation_forest': detect_anomalies_isolation_forest,
+    'lof': detect_anomalies_lof,
+    'ensemble': lambda df, cols: detect_anomalies_ensemble(df, cols)['is_anomaly'],
+    'rolling_grouped': _grouped(lambda long: detect_anomalies_rolling_grouped(long, 'value', 'entity', window=7)),
+    'stl_grouped': _grouped(
+        lambda long: detect_anomalies_stl_grouped(long, 'value', 'entity', 'timestamp', period=24)[0]
+    ),
+}
+
+# Detectors that are too slow to run past this many rows by default
+ROW_LIMITS = {'lof': 200_000, 'rolling_mad': 1_000_000, 'stl': 1_000_000, 'stl_grouped': 1_000_000}
+
+
+def _run_detector(name: str, df: pd.DataFrame) -> np.ndarray:
+    columns = list(df.columns)
+    if name in SERIES_DETECTORS:
+        detector = SERIES_DETECTORS[name]
+        return np.column_stack([detector(df[col]).to_numpy() for col in columns])
+
+    result = FRAME_DETECTORS[name](df, columns)
+    if isinstance(result, pd.DataFrame):
+        # matrix returns one flag column per (column, method): any method counts
+        flags = result.to_numpy().reshape(len(df), len(columns), -1)
+        return flags.any(axis=2)
+    return result.to_numpy()
+
+
+def _ratio(numerator: int, denominator: int) -> float | None:
+    # None rather than NaN so output stays strict JSON
+    return round(float(numerator / denominator), 4) if denominator else None
+
+
+def _precision_recall(predicted: np.ndarray, truth: np.ndarray) -> tuple[float | None, float | None]:
+    if predicted.ndim == 1 and truth.ndim == 2:
+        truth = truth.any(axis=1)
+    true_positives = (predicted & truth).sum()
+    return _ratio(true_positives, predicted.sum()), _ratio(true_positives, truth.sum())
+
+
+def _measure(fn: Callable[[], np.ndarray], repeat: int, memory: bool) -> tuple[np.ndarray, float, int | None]:
+    """Best-of-`repeat` wall time, then one traced run for peak allocated bytes."""
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        seconds.append(time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, min(seconds), peak
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+
+def _run_metadata(seed: int) -> dict:
+    import sklearn
+    return {
+        'run_id': datetime.now().strftime('%Y%m%dT%H%M%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'sklearn': sklearn.__version__,
+        'seed': seed,
+    }
+
+
+def benchmark_detectors(
+    row_counts: list[int],
+    col_counts: list[int],
+    detectors: list[str] | None = None,
+    repeat: int = 3,
+    memory: bool = True,
+    seed: int = 0
+) -> list[dict]:
+    """Time every detector across row and column counts.
+
+    Records best-of-`repeat` seconds, peak traced allocation (tracemalloc,
+    which sees NumPy buffers) and precision/recall against injected spikes.
+    Detectors in ROW_LIMITS are skipped above their limit.
+    """
+    detectors = detectors or [*SERIES_DETECTORS, *FRAME_DETECTORS]
+    meta = _run_metadata(seed)
+    results = []
+
+    for n_rows in row_counts:
+        for n_cols in col_counts:
+            df, truth = make_time_series(n_rows, n_cols, seed=seed)
+            for name in detectors:
+                if n_rows > ROW_LIMITS.get(name, float('inf')):
+                    continue
+                predicted, seconds, peak = _measure(lambda: _run_detector(name, df), repeat, memory)
+                precision, recall = _precision_recall(predicted, truth)
+
+                record = {
+                    **meta,
+                    'benchmark': 'detectors',
+                    'detector': name,
+                    'rows': n_rows,
+                    'cols': n_cols,
+                    'seconds': round(seconds, 6),
+                    'peak_bytes': peak,
+                    'precision': precision,
+                    'recall': recall,
+                }
+                results.append(record)
+                print(json.dumps(record), file=sys.stderr)
+    return results
+
+
+def benchmark_lof(
+    row_counts: list[int],
+    exact_max_rows: int = 200_000,
+    sample_size: int = 50_000,
+    seed: int = 0
+) -> list[dict]:
+    """Runtime and recall of detect_anomalies_lof_scalable vs exact LOF.
+
+    Exact LOF is only run up to exact_max_rows (it is quadratic in practice);
+    beyond that, recall is reported against the injected ground truth only.
+    """
+    meta = _run_metadata(seed)
+    results = []
+    for n_rows in row_counts:
+        df, truth = make_blobs_with_outliers(n_rows, seed=seed)
+        columns = list(df.columns)
+
+        start = time.perf_counter()
+        scalable = detect_anomalies_lof_scalable(df, columns, sample_size=sample_size).to_numpy()
+        scalable_seconds = time.perf_counter() - start
+
+        record = {
+            **meta,
+            'benchmark': 'lof',
+            'rows': n_rows,
+            'sample_size': sample_size,
+            'scalable_seconds': round(scalable_seconds, 3),
+            'scalable_recall_vs_truth': _ratio((scalable & truth).sum(), truth.sum()),
+            'exact_seconds': None,
+            'exact_recall_vs_truth': None,
+            'recall_vs_exact': None,
+        }
+
+        if n_rows <= exact_max_rows:
+            start = time.perf_counter()
+            exact = detect_anomalies_lof(df, columns).to_numpy()
+            record['exact_seconds'] = round(time.perf_counter() - start, 3)
+            record['exact_recall_vs_truth'] = _ratio((exact & truth).sum(), truth.sum())
+            record['recall_vs_exact'] = _ratio((scalable & exact).sum(), exact.sum())
+
+        results.append(record)
+        print(json.dumps(record), file=sys.stderr)
+    return results
+
+
+# =============================================================================
+# Comparison
+# =============================================================================
+
+def _latest_run(path: str) -> dict[tuple, dict]:
+    with open(path) as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    records = [r for r in records if r.get('benchmark') == 'detectors']
+    if not records:
+        return {}
+    run_id = max(r['run_id'] for r in records)
+    return {(r['detector'], r['rows'], r['cols']): r for r in records if r['run_id'] == run_id}
+
+
+def compare_results(baseline_path: str, current_path: str, tolerance_pct: float = 20) -> list[dict]:
+    """Compare the latest 'detectors' run in two result files.
+
+    Returns:
+        One dict per shared (detector, rows, cols) with time/memory ratios and
+        a 'regressed' flag when either grows by more than tolerance_pct
+    """
+    baseline = _latest_run(baseline_path)
+    current = _latest_run(current_path)
+    limit = 1 + tolerance_pct / 100
+
+    comparisons = []
+    for key in sorted(baseline.keys() & current.keys()):
+        old, new = baseline[key], current[key]
+        time_ratio = new['seconds'] / old['seconds'] if old['seconds'] else float('nan')
+        memory_ratio = (
+            new['peak_bytes'] / old['peak_bytes']
+            if old.get('peak_bytes') and new.get('peak_bytes') else None
+        )
+        comparisons.append({
+            'detector': key[0],
+            'rows': key[1],
+            'cols': key[2],
+            'time_ratio': round(time_ratio, 3),
+            'memory_ratio': round(memory_ratio, 3) if memory_ratio is not None else None,
+            'recall_change': (
+                round(new['recall'] - old['recall'], 4)
+                if old['recall'] is not None and new['recall'] is not None else None
+            ),
+            'regressed': time_ratio > limit or (memory_ratio is not None and memory_ratio > limit),
+        })
+    return comparisons
+
+
+def _write_results(results: list[dict], output: str) -> None:
+    with open(output, "a") as f:
+        for record in results:
+            f.write(json.dumps(record) + "\n")
+    print(f"Wrote {len(results)} results to {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark anomaly detection methods",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    subparsers = parser.add_subparsers(dest="suite", required=True)
+
+    detectors = subparsers.add_parser("detectors", help="Time every detector across rows/cols")
+    detectors.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    detectors.add_argument("--cols", type=int, nargs="+", default=[1, 10, 50])
+    detectors.add_argument(
+        "--detectors",
+        nargs="+",
+        choices=[*SERIES_DETECTORS, *FRAME_DETECTORS],
+        help="Subset of detectors (default: all)",
+    )
+    detectors.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is kept)")
+    detectors.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory run")
+    detectors.add_argument("--seed", type=int, default=0)
+    detectors.add_argument("--output", "-o", default="benchmark_results.jsonl", help="JSON lines output file")
+
+    lof = subparsers.add_parser("lof", help="Scalable vs exact LOF runtime and recall")
+    lof.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[100_000, 1_000_000, 10_000_000],
+        help="Row counts to benchmark (default: 1e5 1e6 1e7)",
+    )
+    lof.add_argument(
+        "--exact-max-rows",
+        type=int,
+        default=200_000,
+        help="Largest row count to also run exact LOF on (default: 200000)",
+    )
+    lof.add_argument("--seed", type=int, default=0)
+    lof.add_argument("--output", "-o", default="benchmark_results.jsonl", help="JSON lines output file")
+
+    compare = subparsers.add_parser("compare", help="Compare the latest detectors run of two result files")
+    compare.add_argument("baseline", help="Baseline JSON lines file")
+    compare.add_argument("current", help="Current JSON lines file")
+    compare.add_argument("--tolerance", type=float, default=20, help="Allowed slowdown/growth in percent")
+
+    args = parser.parse_args()
+
+    if args.suite == "detectors":
+        results = benchmark_detectors(
+            args.rows,
+            args.cols,
+            detectors=args.detectors,
+            repeat=args.repeat,
+            memory=not args.no_memory,
+            seed=args.seed,
+        )
+        _write_results(results, args.output)
+    elif args.suite == "lof":
+        results = benchmark_lof(args.rows, exact_max_rows=args.exact_max_rows, seed=args.seed)
+        _write_results(results, args.output)
+    else:
+        comparisons = compare_results(args.baseline, args.current, args.tolerance)
+        for row in comparisons:
+            print(json.dumps(row))
+        if any(row['regressed'] for row in comparisons):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for profiling.py.
+
+Usage:
+    python benchmark_profiling.py profile [--rows N ...] [--cols N ...] [--repeat N] [--output FILE]
+
+Examples:
+    python benchmark_profiling.py profile
+    python benchmark_profiling.py profile --rows 100000 --cols 500 2000 --mix numeric --output wide.jsonl
+
+The profile suite times profile_dataframe(engine='pandas') (one set of
+reductions per column) against profile_dataframe(engine='vectorized')
+(per-dtype 2-D blocks) on wide synthetic frames, and checks both return the
+same profile dict. Each run appends one JSON object per measurement to
+--output (JSON lines), tagged with a run id, library versions and the
+generator seed.
+"""
+
+import argparse
+import json
+import math
+import platform
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from profiling import profile_dataframe
+
+
+MIXES = {
+    'numeric': ('float', 'int'),
+    'mixed': ('float', 'int', 'float', 'int', 'datetime', 'string'),
+}
+
+
+# =============================================================================
+# Synthetic Data
+# =============================================================================
+
+def make_wide_frame(n_rows: int, n_cols: int, mix: str = 'mixed', seed: int = 0) -> pd.DataFrame:
+    """Frame cycling through the column kinds of `mix`; about 2% of floats are NaN."""
+    rng = np.random.default_rng(seed)
+    kinds = MIXES[mix]
+    data = {}
+    for i in range(n_cols):
+        kind = kinds[i % len(kinds)]
+        if kind == 'float':
+            values = rng.normal(100, 30, n_rows)
+            values[rng.random(n_rows) < 0.02] = np.nan
+        elif kind == 'int':
+            values = rng.integers(-10, 1000, n_rows)
+        elif kind == 'datetime':
+            values = pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 10**7, n_rows), unit='s')
+        else:
+            values = pd.Series(rng.choice(['new', 'paid', 'shipped', 'void'], n_rows), dtype=object)
+        data[f'{kind}_{i}'] = values
+    return pd.DataFrame(data)
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+def _best_time(fn, repeat: int) -> tuple[dict, float]:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def _same(a, b) -> bool:
+    """Equality with NaN == NaN, recursing into dicts."""
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_same(a[k], b[k]) for k in a)
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    return a == b
+
+
+def _run_metadata(seed: int) -> dict:
+    return {
+        'run_id': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'seed': seed,
+    }
+
+
+def benchmark_profile(
+    rows: list[int],
+    cols: list[int],
+    mix: str = 'mixed',
+    repeat: int = 3,
+    block_size: int = 64,
+    seed: int = 0
+) -> list[dict]:
+    """Per-column vs vectorized profile_dataframe for each rows x cols size."""
+    meta = _run_metadata(seed)
+    results = []
+    for n_cols in cols:
+        for n_rows in rows:
+            df = make_wide_frame(n_rows, n_cols, mix, seed)
+            per_column, pandas_seconds = _best_time(lambda: profile_dataframe(df), repeat)
+            vectorized, vectorized_seconds = _best_time(
+                lambda: profile_dataframe(df, engine='vectorized', block_size=block_size), repeat
+            )
+
+            record = {
+                **meta,
+                'suite': 'profile',
+                'mix': mix,
+                'rows': n_rows,
+                'cols': n_cols,
+                'block_size': block_size,
+                'pandas_seconds': round(pandas_seconds, 6),
+                'vectorized_seconds': round(vectorized_seconds, 6),
+                'speedup': round(pandas_seconds / vectorized_seconds, 2),
+                'match': _same(per_column, vectorized),
+            }
+            print(json.dumps(record))
+            results.append(record)
+    return results
+
+
+def _write_results(results: list[dict], output: str) -> None:
+    with open(output, "a") as f:
+        for record in results:
+            f.write(json.dumps(record) + "\n")
+    print(f"Wrote {len(results)} results to {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark data profiling",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    subparsers = parser.add_subparsers(dest="suite", required=True)
+
+    profile = subparsers.add_parser("profile", help="Per-column vs vectorized profile_dataframe")
+    profile.add_argument("--rows", type=int, nargs="+", default=[100_000])
+    profile.add_argument("--cols", type=int, nargs="+", default=[500, 1000])
+    profile.add_argument("--mix", choices=sorted(MIXES), default="mixed", help="Column kinds to cycle through")
+    profile.add_argument("--block-size", type=int, default=64, help="Columns per 2-D block")
+    profile.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is kept)")
+    profile.add_argument("--seed", type=int, default=0)
+    profile.add_argument("--output", "-o", default="benchmark_results.jsonl", help="JSON lines output file")
+
+    args = parser.parse_args()
+
+    results = benchmark_profile(
+        args.rows,
+        args.cols,
+        mix=args.mix,
+        repeat=args.repeat,
+        block_size=args.block_size,
+        seed=args.seed,
+    )
+    _write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
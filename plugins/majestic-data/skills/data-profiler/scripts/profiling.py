@@ -4,18 +4,26 @@ Data profiling functions for pandas DataFrames.
 Comprehensive profiling, correlation analysis, and missing data patterns.
 """
 
+import numpy as np
 import pandas as pd
 
 
-def profile_dataframe(df: pd.DataFrame) -> dict:
+def profile_dataframe(df: pd.DataFrame, engine: str = 'pandas', block_size: int = 64) -> dict:
     """Generate comprehensive profile of DataFrame.
 
     Args:
         df: pandas DataFrame to profile
+        engine: 'pandas' (per-column) or 'vectorized' (per-dtype blocks, same result)
+        block_size: Columns per 2-D block in the vectorized engine
 
     Returns:
         Dictionary with shape, memory, and per-column statistics
     """
+    if engine == 'vectorized':
+        return _profile_vectorized(df, block_size)
+    if engine != 'pandas':
+        raise ValueError(f"Unknown engine: {engine}")
+
     profile = {
         'shape': df.shape,
         'memory_mb': df.memory_usage(deep=True).sum() / 1024**2,
@@ -59,6 +67,152 @@ def profile_dataframe(df: pd.DataFrame) -> dict:
     return profile
 
 
+def _base_profile(dtype, null_count: int, unique_count: int, n_rows: int) -> dict:
+    return {
+        'dtype': str(dtype),
+        'null_count': null_count,
+        'null_pct': round(np.float64(null_count) / n_rows * 100, 2),
+        'unique_count': unique_count,
+        'unique_pct': round(unique_count / n_rows * 100, 2),
+    }
+
+
+def _profile_numeric_block(values: np.ndarray, dtype, n_rows: int) -> list[dict]:
+    """Profiles for a (n_columns, n_rows) int64/float64 block.
+
+    One sort per block yields min, max, median and the distinct count; sums
+    and squared deviations follow pandas' nanops (NaN zeroed, pairwise sums
+    along each contiguous row), so results equal the per-column reductions.
+    """
+    is_float = values.dtype.kind == 'f'
+    mask = np.isnan(values) if is_float else np.zeros(values.shape, dtype=bool)
+    nulls = np.count_nonzero(mask, axis=1)
+    count = n_rows - nulls
+
+    ordered = np.sort(values, axis=1)  # NaN sorts last
+    changes = np.ones(values.shape, dtype=bool)
+    np.not_equal(ordered[:, 1:], ordered[:, :-1], out=changes[:, 1:])
+    if is_float:
+        changes &= ~np.isnan(ordered)
+    unique = np.count_nonzero(changes, axis=1)
+
+    filled = np.where(mask, 0, values) if is_float else values
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = filled.sum(axis=1, dtype=np.float64) / count
+        deviations = (mean[:, None] - filled.astype(np.float64, copy=False)) ** 2
+        np.putmask(deviations, mask, 0)
+        std = np.sqrt(deviations.sum(axis=1, dtype=np.float64) / (count - 1))
+    del deviations
+    std[count <= 1] = np.nan
+    zeros = np.count_nonzero(values == 0, axis=1)
+    negatives = np.count_nonzero(values < 0, axis=1)
+
+    profiles = []
+    for j in range(len(values)):
+        k = int(count[j])
+        col_profile = _base_profile(dtype, int(nulls[j]), int(unique[j]), n_rows)
+        if k:
+            low, high = ordered[j, (k - 1) // 2], ordered[j, k // 2]
+            median = (float(low) + float(high)) / 2
+            minimum, maximum = float(ordered[j, 0]), float(ordered[j, k - 1])
+        else:
+            median = minimum = maximum = float('nan')
+        col_profile.update({
+            'min': minimum,
+            'max': maximum,
+            'mean': float(mean[j]),
+            'std': float(std[j]),
+            'median': median,
+            'zeros': int(zeros[j]),
+            'negatives': int(negatives[j]),
+        })
+        profiles.append(col_profile)
+    return profiles
+
+
+def _profile_datetime_block(values: np.ndarray, dtype, n_rows: int) -> list[dict]:
+    """Profiles for a (n_columns, n_rows) naive datetime64 block (NaT sorts first)."""
+    ordered = np.sort(values.view(np.int64), axis=1)
+    nat = np.iinfo(np.int64).min
+    nulls = np.count_nonzero(ordered == nat, axis=1)
+    changes = np.ones(ordered.shape, dtype=bool)
+    np.not_equal(ordered[:, 1:], ordered[:, :-1], out=changes[:, 1:])
+    changes &= ordered != nat
+    unique = np.count_nonzero(changes, axis=1)
+
+    profiles = []
+    for j in range(len(ordered)):
+        col_profile = _base_profile(dtype, int(nulls[j]), int(unique[j]), n_rows)
+        if nulls[j] < n_rows:
+            first, last = ordered[j, nulls[j]], ordered[j, -1]
+            min_date = pd.Timestamp(np.int64(first).view(values.dtype))
+            max_date = pd.Timestamp(np.int64(last).view(values.dtype))
+        else:
+            min_date = max_date = pd.NaT
+        col_profile.update({
+            'min_date': str(min_date),
+            'max_date': str(max_date),
+            'date_range_days': int((max_date - min_date).days),
+        })
+        profiles.append(col_profile)
+    return profiles
+
+
+def _profile_column(series: pd.Series, n_rows: int) -> dict:
+    """Fallback for columns outside the vectorized blocks, one pass per statistic."""
+    null_count = int(series.isnull().sum())
+    if series.dtype == 'object':
+        counts = series.value_counts()
+        col_profile = _base_profile(series.dtype, null_count, len(counts), n_rows)
+        lengths = series.str.len()
+        has_values = null_count < n_rows
+        col_profile.update({
+            'min_length': int(lengths.min()) if has_values else 0,
+            'max_length': int(lengths.max()) if has_values else 0,
+            'top_values': counts.head(5).to_dict(),
+        })
+        return col_profile
+
+    col_profile = _base_profile(series.dtype, null_count, int(series.nunique()), n_rows)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        min_date, max_date = series.min(), series.max()
+        col_profile.update({
+            'min_date': str(min_date),
+            'max_date': str(max_date),
+            'date_range_days': int((max_date - min_date).days),
+        })
+    return col_profile
+
+
+def _profile_vectorized(df: pd.DataFrame, block_size: int = 64) -> dict:
+    """profile_dataframe computed per dtype group over 2-D blocks."""
+    n_rows = len(df)
+    column_profiles = {}
+    groups: dict[str, list[int]] = {}
+    for i, dtype in enumerate(df.dtypes):
+        is_naive_datetime = isinstance(dtype, np.dtype) and dtype.kind == 'M'
+        if dtype in ['int64', 'float64'] or is_naive_datetime:
+            groups.setdefault(str(dtype), []).append(i)
+        else:
+            column_profiles[i] = _profile_column(df.iloc[:, i], n_rows)
+
+    for dtype_name, positions in groups.items():
+        for start in range(0, len(positions), block_size):
+            block = positions[start:start + block_size]
+            values = np.ascontiguousarray(df.iloc[:, block].to_numpy().T)
+            if values.dtype.kind == 'M':
+                profiles = _profile_datetime_block(values, dtype_name, n_rows)
+            else:
+                profiles = _profile_numeric_block(values, dtype_name, n_rows)
+            column_profiles.update(zip(block, profiles))
+
+    return {
+        'shape': df.shape,
+        'memory_mb': df.memory_usage(deep=True).sum() / 1024**2,
+        'columns': {col: column_profiles[i] for i, col in enumerate(df.columns)}
+    }
+
+
 def print_profile_summary(profile: dict) -> None:
     """Print human-readable profile summary."""
     print(f"Shape: {profile['shape'][0]:,} rows x {profile['shape'][1]} columns")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for quality_metrics.py.
+
+Usage:
+    python benchmark_quality.py drift [--rows N ...] [--cols N ...] [--mix MIX] [--repeat N] [--output FILE]
+
+Examples:
+    python benchmark_quality.py drift
+    python benchmark_quality.py drift --rows 100000 --cols 64 256 --mix mixed --output drift.jsonl
+
+The drift suite times detect_distribution_drift called once per column
+against detect_table_drift on the same baseline/current frames, and checks
+both report the same statistic, p-value and drifted flag for every column.
+The default 'float' mix is all-float64, so each block is a single-dtype
+(read-only, copy-on-write) view; 'mixed' cycles float, int and string
+columns. Each run appends one JSON object per measurement to --output
+(JSON lines), tagged with a run id, library versions and the generator seed.
+"""
+
+import argparse
+import json
+import platform
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from quality_metrics import detect_distribution_drift, detect_table_drift
+
+
+MIXES = {
+    'float': ('float',),
+    'mixed': ('float', 'int', 'string'),
+}
+
+
+# =============================================================================
+# Synthetic Data
+# =============================================================================
+
+def make_drift_frames(
+    n_rows: int,
+    n_cols: int,
+    mix: str = 'float',
+    seed: int = 0
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Baseline and current frames; every other column drifts in the current frame."""
+    rng = np.random.default_rng(seed)
+    kinds = MIXES[mix]
+    baseline, current = {}, {}
+    for i in range(n_cols):
+        kind = kinds[i % len(kinds)]
+        shift = 0.1 * (i % 2)
+        col = f'{kind}_{i}'
+        if kind == 'float':
+            baseline[col] = rng.normal(100, 30, n_rows)
+            current[col] = rng.normal(100 + 30 * shift, 30, n_rows)
+            current[col][rng.random(n_rows) < 0.01] = np.nan
+        elif kind == 'int':
+            baseline[col] = rng.integers(0, 1000, n_rows)
+            current[col] = rng.integers(int(1000 * shift), 1000, n_rows)
+        else:
+            categories = ['new', 'paid', 'shipped', 'void']
+            baseline[col] = rng.choice(categories, n_rows, p=[0.3, 0.3, 0.3, 0.1])
+            current[col] = rng.choice(categories, n_rows, p=[0.3 - shift, 0.3, 0.3, 0.1 + shift])
+    return pd.DataFrame(baseline), pd.DataFrame(current)
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+def _best_time(fn, repeat: int):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def _same_drift(per_column: dict, table: pd.DataFrame) -> bool:
+    """Per-column results equal detect_table_drift rows (statistic to 1e-12)."""
+    for row in table.itertuples(index=False):
+        expected = per_column[row.column]
+        if expected['test'] != row.test or bool(expected['drifted']) != bool(row.drifted):
+            return False
+        if not np.isclose(expected['statistic'], row.statistic, rtol=0, atol=1e-12, equal_nan=True):
+            return False
+        if not np.isclose(expected['p_value'], row.p_value, rtol=1e-9, atol=0, equal_nan=True):
+            return False
+    return len(table) == len(per_column)
+
+
+def _run_metadata(seed: int) -> dict:
+    return {
+        'run_id': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'seed': seed,
+    }
+
+
+def benchmark_drift(
+    rows: list[int],
+    cols: list[int],
+    mix: str = 'float',
+    repeat: int = 3,
+    seed: int = 0
+) -> list[dict]:
+    """Per-column detect_distribution_drift vs detect_table_drift for each rows x cols size."""
+    meta = _run_metadata(seed)
+    results = []
+    for n_cols in cols:
+        for n_rows in rows:
+            baseline, current = make_drift_frames(n_rows, n_cols, mix, seed)
+            per_column, loop_seconds = _best_time(
+                lambda: {col: detect_distribution_drift(baseline[col], current[col]) for col in baseline.columns},
+                repeat
+            )
+            table, table_seconds = _best_time(lambda: detect_table_drift(baseline, current), repeat)
+
+            record = {
+                **meta,
+                'suite': 'drift',
+                'mix': mix,
+                'rows': n_rows,
+                'cols': n_cols,
+                'loop_seconds': round(loop_seconds, 6),
+                'table_seconds': round(table_seconds, 6),
+                'speedup': round(loop_seconds / table_seconds, 2),
+                'drifted': int(table['drifted'].sum()),
+                'match': _same_drift(per_column, table),
+            }
+            print(json.dumps(record))
+            results.append(record)
+    return results
+
+
+def _write_results(results: list[dict], output: str) -> None:
+    with open(output, "a") as f:
+        for record in results:
+            f.write(json.dumps(record) + "\n")
+    print(f"Wrote {len(results)} results to {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark data quality metrics",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    subparsers = parser.add_subparsers(dest="suite", required=True)
+
+    drift = subparsers.add_parser("drift", help="Per-column vs whole-table drift detection")
+    drift.add_argument("--rows", type=int, nargs="+", default=[20_000, 100_000])
+    drift.add_argument("--cols", type=int, nargs="+", default=[16, 64])
+    drift.add_argument("--mix", choices=sorted(MIXES), default="float", help="Column kinds to cycle through")
+    drift.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is kept)")
+    drift.add_argument("--seed", type=int, default=0)
+    drift.add_argument("--output", "-o", default="benchmark_results.jsonl", help="JSON lines output file")
+
+    args = parser.parse_args()
+
+    results = benchmark_drift(
+        args.rows,
+        args.cols,
+        mix=args.mix,
+        repeat=args.repeat,
+        seed=args.seed,
+    )
+    _write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
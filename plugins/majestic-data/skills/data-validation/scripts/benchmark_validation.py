@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for validators.py.
+
+Usage:
+    python benchmark_validation.py rules [--rows N ...] [--cols N ...] [--repeat N] [--output FILE]
+
+Examples:
+    python benchmark_validation.py rules
+    python benchmark_validation.py rules --rows 1000000 10000000 --cols 4 16 --output fused.jsonl
+
+The rules suite times the run_validation_pipeline lambda chain (one check
+per rule, without DataValidator's tracemalloc instrumentation) against
+compile_validation_rules(...).validate (one fused pass) on the same config,
+and checks both report the same messages and failure counts. Each run
+appends one JSON object per measurement to --output (JSON lines), tagged
+with a run id, library versions and the generator seed.
+"""
+
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from validators import (
+    DataValidator,
+    compile_validation_rules,
+    validate_date_range,
+    validate_not_null,
+    validate_value_in_set,
+)
+
+
+# =============================================================================
+# Synthetic Data
+# =============================================================================
+
+def make_rule_frame(n_rows: int, n_cols: int = 4, seed: int = 0) -> tuple[pd.DataFrame, dict]:
+    """Frame cycling through datetime, float, int and string columns, plus a config.
+
+    Every column gets a not_null rule; datetime/float/int columns a range
+    rule and string/int columns a set-membership rule. About 1% of float
+    values are NaN and a few percent of values break each rule.
+    """
+    rng = np.random.default_rng(seed)
+    data = {}
+    config = {'date_ranges': {}, 'value_sets': {}, 'not_null': []}
+    for i in range(n_cols):
+        kind = ('ts', 'amount', 'qty', 'status')[i % 4]
+        col = f'{kind}_{i}'
+        if kind == 'ts':
+            data[col] = pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(-3, 370, n_rows), unit='D')
+            config['date_ranges'][col] = (pd.Timestamp('2024-01-01'), pd.Timestamp('2024-12-31'))
+        elif kind == 'amount':
+            values = rng.normal(100, 30, n_rows)
+            values[rng.random(n_rows) < 0.01] = np.nan
+            data[col] = values
+            config['date_ranges'][col] = (0, 200)
+        elif kind == 'qty':
+            data[col] = rng.integers(0, 105, n_rows)
+            config['date_ranges'][col] = (0, 100)
+            config['value_sets'][col] = set(range(100))
+        else:
+            data[col] = rng.choice(['new', 'paid', 'shipped', 'void'], n_rows, p=[0.3, 0.3, 0.38, 0.02])
+            config['value_sets'][col] = {'new', 'paid', 'shipped'}
+        config['not_null'].append(col)
+    return pd.DataFrame(data), config
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+def _measure(fn: Callable[[], dict], repeat: int, memory: bool) -> tuple[dict, float, int | None]:
+    """Best wall time over `repeat` runs, plus tracemalloc peak of one extra run."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        report = fn()
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return report, best, peak
+
+
+def _lambda_chain(config: dict) -> DataValidator:
+    """The checks run_validation_pipeline builds for the row-local rules."""
+    validator = DataValidator()
+    for col, (min_d, max_d) in config['date_ranges'].items():
+        validator.add_check(lambda df, c=col, mn=min_d, mx=max_d: validate_date_range(df, c, mn, mx))
+    for col, valid_values in config['value_sets'].items():
+        validator.add_check(lambda df, c=col, v=valid_values: validate_value_in_set(df, c, v))
+    for col in config['not_null']:
+        validator.add_check(lambda df, c=col: validate_not_null(df, c))
+    return validator
+
+
+def _outcomes(report: dict) -> list[tuple]:
+    return [(check['message'], check['failed_count']) for check in report['checks']]
+
+
+def _run_metadata(seed: int) -> dict:
+    return {
+        'run_id': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'seed': seed,
+    }
+
+
+def benchmark_rules(
+    rows: list[int],
+    cols: list[int],
+    repeat: int = 3,
+    memory: bool = True,
+    seed: int = 0
+) -> list[dict]:
+    """Lambda-chain pipeline vs compiled fused rules for each rows x cols size."""
+    meta = _run_metadata(seed)
+    results = []
+    for n_cols in cols:
+        for n_rows in rows:
+            df, config = make_rule_frame(n_rows, n_cols, seed)
+            compiled = compile_validation_rules(config)
+            validator = _lambda_chain(config)
+
+            chain, chain_seconds, chain_peak = _measure(
+                lambda: validator.validate(df), repeat, memory
+            )
+            fused, fused_seconds, fused_peak = _measure(lambda: compiled.validate(df), repeat, memory)
+
+            record = {
+                **meta,
+                'suite': 'rules',
+                'rows': n_rows,
+                'cols': n_cols,
+                'rules': len(compiled.rules),
+                'chain_seconds': round(chain_seconds, 6),
+                'fused_seconds': round(fused_seconds, 6),
+                'speedup': round(chain_seconds / fused_seconds, 2),
+                'chain_peak_bytes': chain_peak,
+                'fused_peak_bytes': fused_peak,
+                'match': _outcomes(chain) == _outcomes(fused),
+            }
+            print(json.dumps(record))
+            results.append(record)
+    return results
+
+
+def _write_results(results: list[dict], output: str) -> None:
+    with open(output, "a") as f:
+        for record in results:
+            f.write(json.dumps(record) + "\n")
+    print(f"Wrote {len(results)} results to {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark data validation",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    subparsers = parser.add_subparsers(dest="suite", required=True)
+
+    rules = subparsers.add_parser("rules", help="Lambda-chain pipeline vs fused compiled rules")
+    rules.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    rules.add_argument("--cols", type=int, nargs="+", default=[4, 16])
+    rules.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is kept)")
+    rules.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory run")
+    rules.add_argument("--seed", type=int, default=0)
+    rules.add_argument("--output", "-o", default="benchmark_results.jsonl", help="JSON lines output file")
+
+    args = parser.parse_args()
+
+    results = benchmark_rules(
+        args.rows,
+        args.cols,
+        repeat=args.repeat,
+        memory=not args.no_memory,
+        seed=args.seed,
+    )
+    _write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
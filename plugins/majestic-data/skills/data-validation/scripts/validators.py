@@ -4,8 +4,18 @@ Custom data validation functions and pipeline helpers.
 Validation patterns for business rules, schema evolution, and test assertions.
 """
 
-from dataclasses import dataclass
-from typing import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+import tracemalloc
+import numpy as np
 import pandas as pd
 
 
@@ -13,44 +23,471 @@ import pandas as pd
 # Validation Result
 # =============================================================================
 
+# Frames at least this long keep failures as a bitmap instead of a row copy
+LAZY_RESULT_MIN_ROWS = 1_000_000
+
+
 @dataclass
 class ValidationResult:
+    """Outcome of one check.
+
+    Small frames carry a copy of the failing rows in failed_rows. In lazy
+    mode failed_rows stays None; failures are kept as a packed bitmap (one
+    bit per row of `source`, no row copies) and materialized on demand with
+    get_failed_rows().
+    """
     passed: bool
     message: str
     failed_rows: pd.DataFrame | None = None
+    failed_count: int = 0
+    failed_bitmap: np.ndarray | None = field(default=None, repr=False)
+    source: pd.DataFrame | None = field(default=None, repr=False)
+
+    @property
+    def failed_positions(self) -> np.ndarray | None:
+        """Row positions (into source) of failing rows, lazy mode only."""
+        if self.failed_bitmap is None:
+            return None
+        return np.flatnonzero(np.unpackbits(self.failed_bitmap, count=len(self.source)))
+
+    def get_failed_rows(self, limit: int | None = 1000) -> pd.DataFrame | None:
+        """Failing rows, at most `limit` of them (None = all)."""
+        if self.failed_rows is not None:
+            return self.failed_rows if limit is None else self.failed_rows.head(limit)
+        positions = self.failed_positions
+        if positions is None:
+            return None
+        return self.source.iloc[positions if limit is None else positions[:limit]]
+
+
+def _failed_result(
+    df: pd.DataFrame,
+    mask: pd.Series | np.ndarray,
+    message: str,
+    lazy: bool | None
+) -> ValidationResult:
+    """Build a failing result, copying rows or keeping a bitmap (lazy)."""
+    mask = np.asarray(mask, dtype=bool)
+    count = int(mask.sum())
+    if lazy is None:
+        lazy = len(df) >= LAZY_RESULT_MIN_ROWS
+    if not lazy:
+        return ValidationResult(passed=False, message=message, failed_rows=df[mask], failed_count=count)
+    return ValidationResult(
+        passed=False,
+        message=message,
+        failed_count=count,
+        failed_bitmap=np.packbits(mask),
+        source=df
+    )
 
 
 # =============================================================================
-# Validation Functions
+# Reference Index
 # =============================================================================
 
-def validate_no_duplicates(df: pd.DataFrame, cols: list[str]) -> ValidationResult:
-    """Check for duplicate rows based on columns."""
-    duplicates = df[df.duplicated(subset=cols, keep=False)]
-    if len(duplicates) > 0:
-        return ValidationResult(
-            passed=False,
-            message=f"Found {len(duplicates)} duplicate rows",
-            failed_rows=duplicates
+REFERENCE_INDEX_VERSION = 3
+
+# XOR tags keeping non-integral floats, strings, times and other objects out
+# of the integer hash domain (pandas hashes int64 and float64 bit patterns alike)
+_FLOAT_KEY_TAG = np.uint64(0x9E3779B97F4A7C15)
+_STR_KEY_TAG = np.uint64(0xC2B2AE3D27D4EB4F)
+_OTHER_KEY_TAG = np.uint64(0x165667B19E3779F9)
+_TIME_KEY_TAGS = {
+    'naive': np.uint64(0x27D4EB2F165667C5),
+    'utc': np.uint64(0x85EBCA77C2B2AE63),
+    'delta': np.uint64(0xFF51AFD7ED558CCD),
+}
+
+
+def _time_kind(value) -> str | None:
+    if isinstance(value, (datetime, np.datetime64)):
+        return 'naive' if getattr(value, 'tzinfo', None) is None else 'utc'
+    if isinstance(value, (timedelta, np.timedelta64)):
+        return 'delta'
+    return None
+
+
+def _hash_numbers(values: np.ndarray) -> np.ndarray:
+    """Hashes of an int64/float64 array; whole-number floats hash as the equal int."""
+    if values.dtype.kind != 'f':
+        return pd.util.hash_array(values.astype(np.int64, copy=False))
+    whole = (values == np.floor(values)) & (np.abs(values) < 2.0**63)
+    hashes = pd.util.hash_array(values) ^ _FLOAT_KEY_TAG
+    hashes[whole] = pd.util.hash_array(values[whole].astype(np.int64))
+    return hashes
+
+
+def _hash_objects(values: np.ndarray) -> np.ndarray:
+    """Hashes of non-null object keys, tagged by type so '1' never matches 1."""
+    if pd.api.types.infer_dtype(values, skipna=False) == 'string':
+        return pd.util.hash_array(values) ^ _STR_KEY_TAG
+
+    hashes = np.empty(len(values), dtype=np.uint64)
+    is_str = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+    is_int = np.fromiter((isinstance(v, (int, np.integer)) for v in values), dtype=bool, count=len(values))
+    is_float = np.fromiter((isinstance(v, (float, np.floating)) for v in values), dtype=bool, count=len(values))
+    time_kinds = np.array([_time_kind(v) for v in values], dtype=object)
+    other = ~(is_str | is_int | is_float)
+    for kind, tag in _TIME_KEY_TAGS.items():
+        is_time = time_kinds == kind
+        if is_time.any():
+            convert = pd.Timedelta if kind == 'delta' else pd.Timestamp
+            ticks = np.array([convert(v).value for v in values[is_time]], dtype=np.int64)
+            hashes[is_time] = pd.util.hash_array(ticks) ^ tag
+            other &= ~is_time
+    if is_str.any():
+        hashes[is_str] = pd.util.hash_array(values[is_str]) ^ _STR_KEY_TAG
+    if is_int.any():
+        try:
+            hashes[is_int] = _hash_numbers(values[is_int].astype(np.int64))
+        except OverflowError:
+            hashes[is_int] = _hash_numbers(values[is_int].astype(np.float64))
+    if is_float.any():
+        hashes[is_float] = _hash_numbers(values[is_float].astype(np.float64))
+    if other.any():
+        tagged = np.array([f'{type(v).__name__}:{v!r}' for v in values[other]], dtype=object)
+        hashes[other] = pd.util.hash_array(tagged) ^ _OTHER_KEY_TAG
+    return hashes
+
+
+def _hash_keys(series: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """64-bit hashes of key values plus their null mask (null rows hash to 0).
+
+    Keys hash equally whenever pandas compares them equal (Series.isin,
+    DataFrame.duplicated), whatever the column dtype: integers of any width
+    and whole-number floats hash as int64 (so 1 == 1.0 and 0.0 == -0.0),
+    and datetimes/timedeltas as nanosecond ticks (tz-aware ones in UTC).
+    Object keys keep their type, so the string '1' does not match 1.
+    """
+    nulls = series.isna().to_numpy()
+    kind = series.dtype.kind
+    if kind in 'iub' and not (kind == 'u' and series.dtype.itemsize == 8):
+        values, hash_values = series.to_numpy(dtype=np.int64, na_value=0), _hash_numbers
+    elif kind == 'f':
+        values, hash_values = series.to_numpy(dtype=np.float64, na_value=np.nan), _hash_numbers
+    elif kind in 'mM':
+        if kind == 'm':
+            tag = _TIME_KEY_TAGS['delta']
+        else:
+            tag = _TIME_KEY_TAGS['naive' if series.dt.tz is None else 'utc']
+        values = pd.Index(series).as_unit('ns').asi8
+
+        def hash_values(ticks: np.ndarray) -> np.ndarray:
+            return pd.util.hash_array(ticks) ^ tag
+    else:
+        values, hash_values = series.to_numpy(dtype=object), _hash_objects
+
+    if not nulls.any():
+        return hash_values(values), nulls
+    hashes = np.zeros(len(values), dtype=np.uint64)
+    hashes[~nulls] = hash_values(values[~nulls])
+    return hashes, nulls
+
+
+class ReferenceIndex:
+    """Reusable lookup of reference keys for referential-integrity checks.
+
+    Holds the sorted distinct 64-bit hashes of the non-null reference keys
+    (8 bytes per key) plus a Bloom filter (~10 bits per key, ~1% false
+    positives) that screens out most missing keys before the exact binary
+    search. save() writes both as .npy files; load(..., mmap=True)
+    memory-maps them, so many processes share one copy through the OS page
+    cache.
+
+    Keys match as in Series.isin (1.0 matches 1, '1' does not), except that
+    null fact keys are always reported missing. A key missing from the
+    reference is reported valid only if its hash collides with a reference
+    key's hash (probability ~ n_keys / 2^64).
+    """
+
+    def __init__(self, hashes: np.ndarray, bloom: np.ndarray, bloom_k: int, fingerprint: str):
+        self.hashes = hashes
+        self.bloom = bloom
+        self.bloom_k = bloom_k
+        self.fingerprint = fingerprint
+
+    @staticmethod
+    def fingerprint_of(reference: pd.Series) -> str:
+        """Content fingerprint of the reference keys (order-sensitive)."""
+        hashes, nulls = _hash_keys(reference)
+        digest = hashlib.sha256(hashes.tobytes())
+        digest.update(np.packbits(nulls).tobytes())
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def _bloom_position(hashes: np.ndarray, n_bits: int, i: int) -> np.ndarray:
+        # Double hashing: position_i = h1 + i * h2 (mod n_bits)
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        return (h1 + np.uint64(i) * h2) % np.uint64(n_bits)
+
+    @classmethod
+    def build(cls, reference: pd.Series, bits_per_key: int = 10, fingerprint: str | None = None) -> 'ReferenceIndex':
+        """Build an index from the reference key column (nulls are skipped)."""
+        row_hashes, nulls = _hash_keys(reference)
+        hashes = np.unique(row_hashes[~nulls])
+
+        n_bits = max(64, 8 * ((len(hashes) * bits_per_key + 7) // 8))
+        k = max(1, round(bits_per_key * np.log(2)))
+        bits = np.zeros(n_bits, dtype=bool)
+        for i in range(k):
+            bits[cls._bloom_position(hashes, n_bits, i)] = True
+
+        if fingerprint is None:
+            digest = hashlib.sha256(row_hashes.tobytes())
+            digest.update(np.packbits(nulls).tobytes())
+            fingerprint = digest.hexdigest()[:16]
+        return cls(hashes, np.packbits(bits), k, fingerprint)
+
+    def contains(self, values: pd.Series, chunk_size: int = 1_000_000) -> np.ndarray:
+        """Boolean array: True where the value exists in the reference (nulls are False).
+
+        Rows are checked chunk_size at a time; within a chunk each Bloom
+        probe re-checks only rows still passing, so temporaries stay at a
+        few arrays of chunk_size 64-bit words.
+        """
+        hashes, nulls = _hash_keys(values)
+        found = np.zeros(len(hashes), dtype=bool)
+        if not len(self.hashes):
+            return found
+
+        n_bits = len(self.bloom) * 8
+        for start in range(0, len(hashes), chunk_size):
+            chunk = hashes[start:start + chunk_size]
+            candidates = np.flatnonzero(~nulls[start:start + chunk_size])
+            for i in range(self.bloom_k):
+                positions = self._bloom_position(chunk[candidates], n_bits, i)
+                bits = self.bloom[positions >> np.uint64(3)] >> (np.uint8(7) - (positions & np.uint64(7)).astype(np.uint8))
+                candidates = candidates[(bits & 1).astype(bool)]
+                if not len(candidates):
+                    break
+
+            idx = np.searchsorted(self.hashes, chunk[candidates])
+            idx[idx == len(self.hashes)] = 0
+            found[start + candidates] = self.hashes[idx] == chunk[candidates]
+        return found
+
+    def save(self, path: str | Path) -> None:
+        """Write the index to a directory (hashes.npy, bloom.npy, meta.json)."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / 'hashes.npy', self.hashes)
+        np.save(path / 'bloom.npy', self.bloom)
+        meta = {
+            'version': REFERENCE_INDEX_VERSION,
+            'fingerprint': self.fingerprint,
+            'bloom_k': self.bloom_k,
+            'n_keys': len(self.hashes),
+        }
+        (path / 'meta.json').write_text(json.dumps(meta))
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> 'ReferenceIndex':
+        """Load a saved index, memory-mapped by default."""
+        path = Path(path)
+        meta = json.loads((path / 'meta.json').read_text())
+        if meta['version'] != REFERENCE_INDEX_VERSION:
+            raise ValueError(f"Index version {meta['version']} != {REFERENCE_INDEX_VERSION}; rebuild it")
+        mmap_mode = 'r' if mmap else None
+        return cls(
+            hashes=np.load(path / 'hashes.npy', mmap_mode=mmap_mode),
+            bloom=np.load(path / 'bloom.npy', mmap_mode=mmap_mode),
+            bloom_k=meta['bloom_k'],
+            fingerprint=meta['fingerprint'],
         )
+
+    @classmethod
+    def load_or_build(
+        cls,
+        path: str | Path,
+        reference: pd.Series,
+        fingerprint: str | None = None
+    ) -> 'ReferenceIndex':
+        """Reuse the saved index while the reference fingerprint is unchanged.
+
+        Pass a cheap fingerprint (file etag, partition timestamp) to skip
+        hashing the reference; by default its content is hashed.
+        """
+        path = Path(path)
+        fingerprint = fingerprint or cls.fingerprint_of(reference)
+        meta_path = path / 'meta.json'
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text())
+            if meta['version'] == REFERENCE_INDEX_VERSION and meta['fingerprint'] == fingerprint:
+                return cls.load(path)
+
+        index = cls.build(reference, fingerprint=fingerprint)
+        index.save(path)
+        return cls.load(path)
+
+
+# =============================================================================
+# Duplicate Detection Engine
+# =============================================================================
+
+@dataclass
+class DuplicateReport:
+    """Duplicate rows found by find_duplicates.
+
+    positions are global row positions (sorted) of the rows flagged under
+    the requested `keep` rule, like np.flatnonzero(df.duplicated(...)).
+    """
+    total_rows: int
+    duplicate_count: int
+    positions: np.ndarray
+
+
+def _hash_key_rows(keys: pd.DataFrame) -> np.ndarray:
+    """Row hashes of key columns, equal whenever DataFrame.duplicated calls rows equal.
+
+    Built on _hash_keys, so a key read as int64 in one chunk and float64 in
+    another (or 0.0 vs -0.0, object 1 vs 1.0) lands in the same partition.
+    """
+    combined = np.zeros(len(keys), dtype=np.uint64)
+    for i in range(keys.shape[1]):
+        hashes, _ = _hash_keys(keys.iloc[:, i])
+        combined = combined * np.uint64(0x100000001B3) ^ hashes
+    return combined
+
+
+def find_duplicates(
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    cols: list[str],
+    keep: str | bool = 'first',
+    n_partitions: int = 64,
+    spill_dir: str | Path | None = None,
+    spill: bool | None = None
+) -> DuplicateReport:
+    """Hash-partitioned duplicate detection for frames or chunk streams.
+
+    Each row's key columns are hashed to 64 bits and routed to one of
+    n_partitions by the hash's top bits; key values are normalized before
+    hashing, so equal keys share a partition even when chunks infer
+    different dtypes for a column. Each partition is then resolved with DataFrame.duplicated on
+    the actual key values, so hash collisions never produce false
+    duplicates. Only one partition (~1/n_partitions of the keys) is in
+    memory at a time when spilling.
+
+    Args:
+        data: DataFrame, or iterable of chunks (e.g. iter_file_chunks) in row order
+        cols: Key columns
+        keep: 'first', 'last' or False, as in DataFrame.duplicated
+        n_partitions: Number of hash partitions (power of two)
+        spill_dir: Parent directory for partition files (default: system temp)
+        spill: Write partitions to disk; default True for chunk streams,
+            False for an in-memory DataFrame
+
+    Returns:
+        DuplicateReport matching df.duplicated(subset=cols, keep=keep)
+    """
+    if n_partitions < 1 or n_partitions & (n_partitions - 1):
+        raise ValueError(f"n_partitions must be a power of two, got {n_partitions}")
+    in_memory = isinstance(data, pd.DataFrame)
+    chunks = [data] if in_memory else data
+    if spill is None:
+        spill = not in_memory
+    shift = np.uint64(64 - n_partitions.bit_length() + 1)
+
+    with tempfile.TemporaryDirectory(dir=spill_dir) as tmp:
+        pieces: dict[int, list[pd.DataFrame]] = {}
+        total_rows = 0
+
+        # Pass 1: route key columns (+ global position) to hash partitions
+        for chunk in chunks:
+            keys = chunk[cols].reset_index(drop=True)
+            hashes = _hash_key_rows(keys)
+            part_ids = (hashes >> shift).astype(np.int64) if n_partitions > 1 else np.zeros(len(keys), np.int64)
+            keys['__position'] = np.arange(total_rows, total_rows + len(keys))
+            total_rows += len(keys)
+
+            order = np.argsort(part_ids, kind='stable')
+            bounds = np.searchsorted(part_ids[order], np.arange(n_partitions + 1))
+            for part in np.flatnonzero(np.diff(bounds)):
+                piece = keys.iloc[order[bounds[part]:bounds[part + 1]]]
+                if spill:
+                    with open(Path(tmp) / f'part-{part}.pkl', 'ab') as f:
+                        pickle.dump(piece, f, protocol=pickle.HIGHEST_PROTOCOL)
+                else:
+                    pieces.setdefault(int(part), []).append(piece)
+
+        # Pass 2: resolve each partition exactly on key values
+        flagged = []
+        for part in range(n_partitions):
+            if spill:
+                path = Path(tmp) / f'part-{part}.pkl'
+                if not path.exists():
+                    continue
+                part_pieces = []
+                with open(path, 'rb') as f:
+                    while True:
+                        try:
+                            part_pieces.append(pickle.load(f))
+                        except EOFError:
+                            break
+            else:
+                part_pieces = pieces.pop(part, [])
+                if not part_pieces:
+                    continue
+            # Pieces arrive in chunk order and stay row-ordered within a chunk
+            frame = pd.concat(part_pieces, ignore_index=True)
+            mask = frame.duplicated(subset=cols, keep=keep).to_numpy()
+            flagged.append(frame['__position'].to_numpy()[mask])
+
+    positions = np.sort(np.concatenate(flagged)) if flagged else np.empty(0, dtype=np.int64)
+    return DuplicateReport(total_rows=total_rows, duplicate_count=len(positions), positions=positions)
+
+
+# =============================================================================
+# Validation Functions
+# =============================================================================
+
+# Each check takes `lazy`: None picks lazy mode for frames of at least
+# LAZY_RESULT_MIN_ROWS rows, True/False forces it.
+
+def validate_no_duplicates(
+    df: pd.DataFrame,
+    cols: list[str],
+    lazy: bool | None = None,
+    engine: str = 'pandas'
+) -> ValidationResult:
+    """Check for duplicate rows based on columns.
+
+    engine='partitioned' uses find_duplicates (hash-partitioned) instead of
+    one DataFrame.duplicated over the full frame; results are identical.
+    """
+    if engine == 'partitioned':
+        mask = np.zeros(len(df), dtype=bool)
+        mask[find_duplicates(df, cols, keep=False).positions] = True
+    else:
+        mask = df.duplicated(subset=cols, keep=False).to_numpy()
+    count = int(mask.sum())
+    if count > 0:
+        return _failed_result(df, mask, f"Found {count} duplicate rows", lazy)
     return ValidationResult(passed=True, message="No duplicates found")
 
 
 def validate_referential_integrity(
     df: pd.DataFrame,
     column: str,
-    reference_df: pd.DataFrame,
-    reference_column: str
+    reference_df: pd.DataFrame | None = None,
+    reference_column: str | None = None,
+    lazy: bool | None = None,
+    reference_index: ReferenceIndex | None = None
 ) -> ValidationResult:
-    """Check foreign key references exist."""
-    valid_values = set(reference_df[reference_column])
-    invalid = df[~df[column].isin(valid_values)]
-    if len(invalid) > 0:
-        return ValidationResult(
-            passed=False,
-            message=f"Found {len(invalid)} rows with invalid references",
-            failed_rows=invalid
-        )
+    """Check foreign key references exist.
+
+    Pass a prebuilt ReferenceIndex to skip rebuilding the reference key set
+    on every call (reference_df/reference_column are then not needed).
+    """
+    if reference_index is not None:
+        mask = ~reference_index.contains(df[column])
+    else:
+        valid_values = set(reference_df[reference_column])
+        mask = ~df[column].isin(valid_values).to_numpy()
+    count = int(mask.sum())
+    if count > 0:
+        return _failed_result(df, mask, f"Found {count} rows with invalid references", lazy)
     return ValidationResult(passed=True, message="All references valid")
 
 
@@ -58,36 +495,45 @@ def validate_date_range(
     df: pd.DataFrame,
     column: str,
     min_date,
-    max_date
+    max_date,
+    lazy: bool | None = None
 ) -> ValidationResult:
     """Check dates within expected range."""
-    out_of_range = df[(df[column] < min_date) | (df[column] > max_date)]
-    if len(out_of_range) > 0:
-        return ValidationResult(
-            passed=False,
-            message=f"Found {len(out_of_range)} rows outside date range",
-            failed_rows=out_of_range
-        )
+    # NA compares as NA in nullable dtypes; like df[mask], treat it as in range
+    mask = ((df[column] < min_date) | (df[column] > max_date)).to_numpy(dtype=bool, na_value=False)
+    count = int(mask.sum())
+    if count > 0:
+        return _failed_result(df, mask, f"Found {count} rows outside date range", lazy)
     return ValidationResult(passed=True, message="All dates in range")
 
 
 def validate_value_in_set(
     df: pd.DataFrame,
     column: str,
-    valid_values: set
+    valid_values: set,
+    lazy: bool | None = None
 ) -> ValidationResult:
     """Check all values in column are from valid set."""
-    invalid = df[~df[column].isin(valid_values)]
-    if len(invalid) > 0:
-        invalid_vals = set(invalid[column].unique())
-        return ValidationResult(
-            passed=False,
-            message=f"Found invalid values: {invalid_vals}",
-            failed_rows=invalid
-        )
+    mask = ~df[column].isin(valid_values).to_numpy()
+    if mask.any():
+        invalid_vals = set(df[column][mask].unique())
+        return _failed_result(df, mask, f"Found invalid values: {invalid_vals}", lazy)
     return ValidationResult(passed=True, message="All values valid")
 
 
+def validate_not_null(
+    df: pd.DataFrame,
+    column: str,
+    lazy: bool | None = None
+) -> ValidationResult:
+    """Check column has no missing values."""
+    mask = df[column].isna().to_numpy()
+    count = int(mask.sum())
+    if count > 0:
+        return _failed_result(df, mask, f"Found {count} null values", lazy)
+    return ValidationResult(passed=True, message="No null values")
+
+
 # =============================================================================
 # Validation Pipeline
 # =============================================================================
@@ -102,17 +548,68 @@ class DataValidator:
         self.checks.append(check)
         return self
 
-    def validate(self, df: pd.DataFrame) -> dict:
-        results = {'passed': True, 'checks': []}
-        for check in self.checks:
+    def validate(self, df: pd.DataFrame, max_workers: int = 1, track_memory: bool = False) -> dict:
+        """Run all checks and return a report.
+
+        Each check entry records wall time ('seconds') and 'rows_scanned'.
+        With track_memory=True it also records 'peak_bytes' (tracemalloc
+        peak above the pre-check baseline); tracing slows allocation-heavy
+        checks several-fold, so it is off by default and peak_bytes is None.
+        With max_workers > 1 checks run concurrently in a thread pool (pandas
+        and NumPy kernels release the GIL); tracemalloc cannot attribute
+        allocations to threads, so per-check peak_bytes is then None and the
+        run's overall peak is reported as results['peak_bytes'].
+
+        Args:
+            df: DataFrame to validate
+            max_workers: Threads for concurrent checks (1 = sequential)
+            track_memory: Measure peak allocations with tracemalloc (opt-in)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        started_tracing = track_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        def run(check: Callable[[pd.DataFrame], ValidationResult]) -> tuple[ValidationResult, float, int | None]:
+            per_check_memory = track_memory and max_workers == 1
+            if per_check_memory:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
             result = check(df)
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] - baseline if per_check_memory else None
+            return result, seconds, peak
+
+        try:
+            if max_workers == 1:
+                outcomes = [run(check) for check in self.checks]
+            else:
+                if track_memory:
+                    tracemalloc.reset_peak()
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    outcomes = list(pool.map(run, self.checks))
+            overall_peak = tracemalloc.get_traced_memory()[1] if track_memory else None
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        results = {'passed': True, 'checks': []}
+        for check, (result, seconds, peak) in zip(self.checks, outcomes):
             results['checks'].append({
                 'name': check.__name__ if hasattr(check, '__name__') else str(check),
                 'passed': result.passed,
-                'message': result.message
+                'message': result.message,
+                'failed_count': result.failed_count,
+                'seconds': round(seconds, 6),
+                'rows_scanned': len(df),
+                'peak_bytes': peak
             })
             if not result.passed:
                 results['passed'] = False
+        if max_workers != 1:
+            results['peak_bytes'] = overall_peak
         return results
 
 
@@ -135,10 +632,506 @@ def run_validation_pipeline(
                 lambda df, c=col, mn=min_d, mx=max_d: validate_date_range(df, c, mn, mx)
             )
 
+    if 'value_sets' in config:
+        for col, valid_values in config['value_sets'].items():
+            validator.add_check(
+                lambda df, c=col, v=valid_values: validate_value_in_set(df, c, v)
+            )
+
+    for col in config.get('not_null', []):
+        validator.add_check(lambda df, c=col: validate_not_null(df, c))
+
     results = validator.validate(df)
     return df, results
 
 
+# =============================================================================
+# Compiled (Fused) Rules
+# =============================================================================
+
+_RULE_CHECKS = {
+    'range': ('validate_date_range', "All dates in range"),
+    'in_set': ('validate_value_in_set', "All values valid"),
+    'not_null': ('validate_not_null', "No null values"),
+}
+
+
+def _set_rule(series: pd.Series, factorized: tuple, valid_values, out: np.ndarray) -> set:
+    """Set-membership over factorized codes; returns the invalid values.
+
+    Membership is tested once per distinct value. Null rows (code -1) are
+    tested individually, since None/NaN/NaT match valid_values differently.
+    The invalid-value set equals validate_value_in_set's, in the same order.
+    """
+    codes, uniques = factorized
+    valid = np.append(pd.Series(uniques).isin(valid_values).to_numpy(), False)
+    np.logical_not(valid[codes], out=out)
+    null_rows = np.flatnonzero(codes == -1)
+    if len(null_rows):
+        out[null_rows] = ~series.iloc[null_rows].isin(valid_values).to_numpy()
+    if not out.any():
+        return set()
+
+    dtype = series.dtype
+    nullable = isinstance(dtype, pd.api.extensions.ExtensionDtype) and not isinstance(
+        dtype, (pd.CategoricalDtype, pd.StringDtype)
+    )
+    if nullable or out[null_rows].any():
+        # Failing nulls, or extension dtypes: exact path, on the column itself
+        return set(series[out].unique())
+    # Codes are numbered by first appearance, matching pd.unique's order
+    return set(np.asarray(uniques)[~valid[:-1]])
+
+
+@dataclass
+class CompiledRules:
+    """Row-local config rules evaluated in one fused pass.
+
+    Rules are grouped by column. Each column is converted to a NumPy array
+    once, and every rule on it writes its failure mask straight into a row
+    of one preallocated (n_rules, n_rows) boolean buffer, using ufunc out=
+    and a single shared scratch row, so no per-rule Series or intermediate
+    masks are allocated. Results match validate_date_range,
+    validate_value_in_set and validate_not_null.
+    """
+    rules: list[tuple[str, str, tuple]]  # (kind, column, args)
+
+    @property
+    def names(self) -> list[str]:
+        return [f'{_RULE_CHECKS[kind][0]}[{column}]' for kind, column, _ in self.rules]
+
+    def evaluate(self, df: pd.DataFrame, invalid_values: dict | None = None) -> np.ndarray:
+        """Failure masks, one row per rule (in self.names order).
+
+        Set rules factorize their column once; pass invalid_values to also
+        collect each set rule's offending values, keyed by rule index.
+        """
+        if invalid_values is None:
+            invalid_values = {}
+        masks = np.empty((len(self.rules), len(df)), dtype=bool)
+        scratch = np.empty(len(df), dtype=bool)
+        by_column: dict[str, list[int]] = {}
+        for row, (_, column, _) in enumerate(self.rules):
+            by_column.setdefault(column, []).append(row)
+
+        for column, rows in by_column.items():
+            series = df[column]
+            values = series.to_numpy() if isinstance(series.dtype, np.dtype) else None
+            kind_code = values.dtype.kind if values is not None else None
+            factorized = None  # shared by every set rule on this column
+            for row in rows:
+                kind, _, args = self.rules[row]
+                out = masks[row]
+                if kind == 'range':
+                    low, high = args
+                    if kind_code not in ('i', 'u', 'f', 'M'):
+                        out[:] = ((series < low) | (series > high)).to_numpy(dtype=bool, na_value=False)
+                        continue
+                    if kind_code == 'M':
+                        low, high = np.datetime64(pd.Timestamp(low)), np.datetime64(pd.Timestamp(high))
+                    np.less(values, low, out=out)
+                    np.greater(values, high, out=scratch)
+                    np.logical_or(out, scratch, out=out)
+                elif kind == 'in_set':
+                    if factorized is None:
+                        factorized = pd.factorize(series)
+                    invalid_values[row] = _set_rule(series, factorized, args[0], out)
+                elif kind_code == 'f':
+                    np.isnan(values, out=out)
+                elif kind_code in ('m', 'M'):
+                    np.isnat(values, out=out)
+                elif kind_code in ('i', 'u', 'b'):
+                    out[:] = False
+                else:
+                    out[:] = series.isna().to_numpy()
+        return masks
+
+    def checks(self, counts, invalid_values: dict) -> list[dict]:
+        """Report entries for per-rule failure counts and set-rule invalid values."""
+        checks = []
+        for row, ((kind, _, _), name, count) in enumerate(zip(self.rules, self.names, counts)):
+            count = int(count)
+            if count == 0:
+                message = _RULE_CHECKS[kind][1]
+            elif kind == 'in_set':
+                message = f"Found invalid values: {invalid_values[row]}"
+            elif kind == 'not_null':
+                message = f"Found {count} null values"
+            else:
+                message = f"Found {count} rows outside date range"
+            checks.append({'name': name, 'passed': count == 0, 'message': message, 'failed_count': count})
+        return checks
+
+    def validate(self, df: pd.DataFrame) -> dict:
+        """Evaluate every rule; report shaped like run_validation_pipeline_file."""
+        invalid_values = {}
+        checks = self.checks(np.count_nonzero(self.evaluate(df, invalid_values), axis=1), invalid_values)
+        return {'passed': all(check['passed'] for check in checks), 'rows': len(df), 'checks': checks}
+
+
+def compile_validation_rules(config: dict) -> CompiledRules:
+    """Compile date_ranges, value_sets and not_null from a pipeline config.
+
+    unique_columns is not row-local and is left to validate_no_duplicates.
+    """
+    rules = [('range', col, tuple(bounds)) for col, bounds in config.get('date_ranges', {}).items()]
+    rules += [('in_set', col, (values,)) for col, values in config.get('value_sets', {}).items()]
+    rules += [('not_null', col, ()) for col in config.get('not_null', [])]
+    return CompiledRules(rules)
+
+
+# =============================================================================
+# File-Backed (Chunked) Validation
+# =============================================================================
+
+def iter_file_chunks(
+    path: str | Path,
+    chunksize: int = 500_000,
+    columns: list[str] | None = None,
+    **read_kwargs
+) -> Iterator[pd.DataFrame]:
+    """Read a CSV or Parquet file in chunks (CSV) or record batches (Parquet).
+
+    Args:
+        path: .csv/.csv.gz or .parquet/.pq file
+        chunksize: Rows per chunk
+        columns: Only read these columns
+        **read_kwargs: Passed to pd.read_csv (e.g. parse_dates, dtype)
+    """
+    path = Path(path)
+    if path.suffix in ('.parquet', '.pq'):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=columns, **read_kwargs)
+
+
+def _count_keys(keys: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
+    """Distinct key rows with their row count in '__count' (null keys compare equal)."""
+    if keys.empty:
+        return keys.assign(__count=pd.Series(dtype=np.int64))
+    counts = keys.groupby(cols, dropna=False, sort=False, observed=True).size()
+    return counts.rename('__count').reset_index()
+
+
+def _duplicate_rows(key_counts: list[pd.DataFrame], cols: list[str]) -> int:
+    """Duplicate-row count (keep=False) over per-partition distinct key counts.
+
+    find_duplicates flags keys present in more than one partition; those
+    plus keys repeated within a partition count every row they cover.
+    """
+    key_counts = [counts for counts in key_counts if len(counts)]
+    if not key_counts:
+        return 0
+    stacked = pd.concat(key_counts, ignore_index=True)
+    shared = np.zeros(len(stacked), dtype=bool)
+    shared[find_duplicates(stacked, cols, keep=False).positions] = True
+    counts = stacked['__count'].to_numpy()
+    return int(counts[shared | (counts > 1)].sum())
+
+
+def _summarize_chunks(chunks: Iterable[pd.DataFrame], config: dict, key_counts: bool = False) -> dict:
+    """Reduce chunks to the state behind a pipeline report.
+
+    Row-local rules (date_ranges, value_sets, not_null) run per chunk as
+    one CompiledRules pass; their failure counts add up ('rule_counts') and
+    set rules keep their distinct invalid values ('invalid_values').
+    unique_columns are resolved exactly on key values by find_duplicates
+    over the chunk stream ('duplicate_rows'). With key_counts=True the
+    summary instead keeps each distinct key with its row count
+    ('key_counts'), so summaries of separate partitions can be merged.
+    """
+    compiled = compile_validation_rules(config)
+    unique_cols = config.get('unique_columns')
+    summary = {
+        'rows': 0,
+        'chunks': 0,
+        'rule_counts': [0] * len(compiled.rules),
+        'invalid_values': {},
+        'duplicate_rows': None,
+        'key_counts': None
+    }
+    key_pieces = []
+
+    def tally(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        for chunk in chunks:
+            summary['rows'] += len(chunk)
+            summary['chunks'] += 1
+            if compiled.rules:
+                invalid_values = {}
+                counts = np.count_nonzero(compiled.evaluate(chunk, invalid_values), axis=1)
+                summary['rule_counts'] = [total + int(count) for total, count in zip(summary['rule_counts'], counts)]
+                _add_invalid_values(summary['invalid_values'], invalid_values)
+            if unique_cols and key_counts:
+                key_pieces.append(_count_keys(chunk[unique_cols], unique_cols))
+            yield chunk
+
+    if unique_cols and not key_counts:
+        summary['duplicate_rows'] = find_duplicates(tally(chunks), unique_cols, keep=False).duplicate_count
+    else:
+        for _ in tally(chunks):
+            pass
+    if unique_cols and key_counts:
+        if key_pieces:
+            stacked = pd.concat(key_pieces, ignore_index=True)
+            grouped = stacked.groupby(unique_cols, dropna=False, sort=False, observed=True)['__count']
+            summary['key_counts'] = grouped.sum().reset_index()
+        else:
+            summary['key_counts'] = _count_keys(pd.DataFrame(columns=unique_cols), unique_cols)
+        summary['duplicate_rows'] = _duplicate_rows([summary['key_counts']], unique_cols)
+    return summary
+
+
+def _add_invalid_values(totals: dict, invalid_values: dict) -> None:
+    """Fold per-rule invalid values into totals (distinct, first-seen order)."""
+    for row, values in invalid_values.items():
+        if values:
+            seen = np.array([*totals.get(row, []), *values], dtype=object)
+            totals[row] = list(pd.unique(seen))
+
+
+def _config_columns(config: dict) -> list[str]:
+    return list(dict.fromkeys([
+        *(config.get('unique_columns') or []),
+        *config.get('date_ranges', {}),
+        *config.get('value_sets', {}),
+        *config.get('not_null', []),
+    ]))
+
+
+def _pipeline_report(summary: dict, config: dict) -> dict:
+    """Build a DataValidator-shaped report from a chunk summary."""
+    check_results = []
+    if config.get('unique_columns'):
+        duplicate_rows = summary['duplicate_rows']
+        if duplicate_rows > 0:
+            result = ValidationResult(
+                passed=False,
+                message=f"Found {duplicate_rows} duplicate rows",
+                failed_count=duplicate_rows
+            )
+        else:
+            result = ValidationResult(passed=True, message="No duplicates found")
+        check_results.append(('validate_no_duplicates', result))
+
+    checks = [
+        {
+            'name': name,
+            'passed': result.passed,
+            'message': result.message,
+            'failed_count': result.failed_count
+        }
+        for name, result in check_results
+    ]
+    invalid_values = {row: set(values) for row, values in summary['invalid_values'].items()}
+    checks += compile_validation_rules(config).checks(summary['rule_counts'], invalid_values)
+    return {
+        'passed': all(check['passed'] for check in checks),
+        'rows': summary['rows'],
+        'chunks': summary['chunks'],
+        'checks': checks
+    }
+
+
+def run_validation_pipeline_file(
+    path: str | Path,
+    config: dict,
+    chunksize: int = 500_000,
+    **read_kwargs
+) -> dict:
+    """Run the run_validation_pipeline config over a CSV/Parquet file in chunks.
+
+    Only the columns referenced by the config are read, one chunk at a time.
+    Row-local checks (date_ranges, value_sets, not_null) run per chunk as
+    one compiled pass and are summed; unique_columns goes
+    through find_duplicates, which spills key columns to hash partitions on
+    disk and resolves them exactly, so memory is bounded by the chunk size
+    plus one partition of keys.
+
+    Returns:
+        Report shaped like DataValidator.validate, plus 'rows' and 'chunks'
+    """
+    columns = _config_columns(config)
+    chunks = iter_file_chunks(path, chunksize, columns=columns or None, **read_kwargs)
+    return _pipeline_report(_summarize_chunks(chunks, config), config)
+
+
+# =============================================================================
+# Incremental Validation
+# =============================================================================
+
+VALIDATION_CACHE_VERSION = 3
+
+
+def partition_fingerprint(partition: pd.DataFrame | str | Path, content_hash: bool = False) -> str:
+    """Fingerprint a partition for the incremental validation cache.
+
+    DataFrames hash their columns, dtypes and row contents. Parquet files
+    hash the file size plus the raw footer (schema, row-group offsets, sizes
+    and column statistics) without reading any data pages; pass
+    content_hash=True to hash the whole file instead. Other files are
+    always content-hashed.
+    """
+    digest = hashlib.sha256()
+    if isinstance(partition, pd.DataFrame):
+        digest.update(json.dumps([list(map(str, partition.columns)), list(map(str, partition.dtypes))]).encode())
+        digest.update(pd.util.hash_pandas_object(partition, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    path = Path(partition)
+    with open(path, 'rb') as f:
+        if path.suffix in ('.parquet', '.pq') and not content_hash:
+            size = f.seek(0, 2)
+            f.seek(-8, 2)
+            tail = f.read(8)
+            if tail[4:] != b'PAR1':
+                raise ValueError(f"Not a Parquet file: {path}")
+            footer_len = int.from_bytes(tail[:4], 'little')
+            f.seek(-8 - footer_len, 2)
+            digest.update(str(size).encode())
+            digest.update(f.read(footer_len))
+        else:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def _canonical(value):
+    """JSON-ready form of a config value that does not depend on the hash seed.
+
+    Sets become sorted lists, so their iteration order cannot leak into
+    cache keys; dicts keep their order (it fixes the rule order of cached
+    summaries). Non-JSON scalars are tagged with their type name.
+    """
+    if isinstance(value, dict):
+        return [[_canonical(k), _canonical(v)] for k, v in value.items()]
+    if isinstance(value, (set, frozenset)):
+        items = [_canonical(v) for v in value]
+        return {'set': sorted(items, key=lambda item: json.dumps(item))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return f'{type(value).__name__}:{value}'
+
+
+class ValidationCache:
+    """On-disk per-partition check summaries, keyed by config and fingerprint.
+
+    Entries are '<key>.pkl' files holding a partition's chunk summary (row
+    count, per-rule failure counts and invalid values, distinct keys with
+    counts). Reads mark
+    an entry as recently used; least recently used entries are evicted once
+    the directory exceeds max_bytes.
+    """
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int = 256 * 1024 ** 2):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(config: dict, fingerprint: str, read_kwargs: dict | None = None) -> str:
+        """Cache key, stable across processes (sets hash in sorted order)."""
+        payload = json.dumps(
+            [VALIDATION_CACHE_VERSION, _canonical(config), fingerprint, _canonical(read_kwargs or {})]
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+    def get(self, key: str) -> dict | None:
+        path = self.cache_dir / f'{key}.pkl'
+        if not path.exists():
+            return None
+        with open(path, 'rb') as f:
+            summary = pickle.load(f)
+        os.utime(path)  # mark as recently used
+        return summary
+
+    def put(self, key: str, summary: dict) -> None:
+        with open(self.cache_dir / f'{key}.pkl', 'wb') as f:
+            pickle.dump(summary, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._evict()
+
+    def size_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self.cache_dir.glob('*.pkl'))
+
+    def _evict(self) -> None:
+        entries = sorted(self.cache_dir.glob('*.pkl'), key=lambda p: p.stat().st_mtime, reverse=True)
+        total = 0
+        for path in entries:
+            total += path.stat().st_size
+            if total > self.max_bytes:
+                path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        for path in self.cache_dir.glob('*.pkl'):
+            path.unlink(missing_ok=True)
+
+
+def _merge_summaries(summaries: list[dict], config: dict) -> dict:
+    """Combine partition summaries as if their rows were one input."""
+    merged = _summarize_chunks([], config, key_counts=True)
+    for s in summaries:
+        merged['rows'] += s['rows']
+        merged['chunks'] += s['chunks']
+        merged['rule_counts'] = [a + b for a, b in zip(merged['rule_counts'], s['rule_counts'])]
+        _add_invalid_values(merged['invalid_values'], s['invalid_values'])
+
+    if summaries and config.get('unique_columns'):
+        merged['key_counts'] = None
+        merged['duplicate_rows'] = _duplicate_rows([s['key_counts'] for s in summaries], config['unique_columns'])
+    return merged
+
+
+def run_validation_pipeline_incremental(
+    partitions: Iterable[pd.DataFrame | str | Path],
+    config: dict,
+    cache: ValidationCache,
+    chunksize: int = 500_000,
+    content_hash: bool = False,
+    **read_kwargs
+) -> dict:
+    """Run the pipeline config over partitions, re-validating only changed ones.
+
+    Each partition (DataFrame or CSV/Parquet path) is fingerprinted with
+    partition_fingerprint. Partitions whose fingerprint is cached under the
+    same config reuse their stored summary; new or changed ones are read
+    and summarized. Summaries merge exactly (counts add; distinct keys are
+    matched across partitions by find_duplicates), so the report equals
+    run_validation_pipeline_file over all rows, including cross-partition
+    duplicates.
+
+    Returns:
+        Report shaped like run_validation_pipeline_file, plus 'partitions'
+        and 'revalidated' (count of partitions that were read)
+    """
+    columns = _config_columns(config)
+    summaries = []
+    revalidated = 0
+    for partition in partitions:
+        is_frame = isinstance(partition, pd.DataFrame)
+        key = cache.key(config, partition_fingerprint(partition, content_hash), None if is_frame else read_kwargs)
+        summary = cache.get(key)
+        if summary is None:
+            if is_frame:
+                chunks = (partition.iloc[i:i + chunksize] for i in range(0, len(partition), chunksize))
+            else:
+                chunks = iter_file_chunks(partition, chunksize, columns=columns or None, **read_kwargs)
+            summary = _summarize_chunks(chunks, config, key_counts=True)
+            cache.put(key, summary)
+            revalidated += 1
+        summaries.append(summary)
+
+    report = _pipeline_report(_merge_summaries(summaries, config), config)
+    report['partitions'] = len(summaries)
+    report['revalidated'] = revalidated
+    return report
+
+
 # =============================================================================
 # Schema Evolution
 # =============================================================================
@@ -161,6 +1154,59 @@ def validate_with_schema_version(data: dict, schema_version: int) -> dict:
     return data
 
 
+def migrate_schema_batch(
+    data: pd.DataFrame,
+    version_col: str = 'schema_version',
+    schema_version: int | None = None
+) -> pd.DataFrame:
+    """Columnar validate_with_schema_version over a whole table.
+
+    A missing key in a record corresponds to a null cell here. Applies the
+    same steps as the per-record function, as vectorized column operations:
+    v1 rows with a name and no first_name get name split on the first space
+    into first_name/last_name (name is nulled, and dropped once empty);
+    rows below v3 get an empty dict for missing metadata.
+
+    Args:
+        data: DataFrame, or pyarrow.Table (converted to pandas)
+        version_col: Column holding each row's schema version
+        schema_version: Version for every row, instead of version_col
+
+    Returns:
+        New DataFrame with every row in the latest schema shape
+    """
+    df = data.copy() if isinstance(data, pd.DataFrame) else data.to_pandas()
+    if schema_version is not None:
+        versions = pd.Series(schema_version, index=df.index)
+    else:
+        versions = df[version_col]
+
+    if 'name' in df.columns:
+        if 'first_name' not in df.columns:
+            df['first_name'] = pd.Series(None, index=df.index, dtype=object)
+        if 'last_name' not in df.columns:
+            df['last_name'] = pd.Series(None, index=df.index, dtype=object)
+
+        split_rows = (versions == 1) & df['name'].notna() & df['first_name'].isna()
+        if split_rows.any():
+            parts = df.loc[split_rows, 'name'].str.split(' ', n=1, expand=True)
+            df.loc[split_rows, 'first_name'] = parts[0]
+            df.loc[split_rows, 'last_name'] = parts[1].fillna('') if 1 in parts else ''
+            df.loc[split_rows, 'name'] = None
+        if df['name'].isna().all():
+            df = df.drop(columns='name')
+
+    if 'metadata' not in df.columns:
+        df['metadata'] = pd.Series(None, index=df.index, dtype=object)
+    fill_rows = (versions < 3) & df['metadata'].isna()
+    if fill_rows.any():
+        # One dict per row so later mutation of a record doesn't alias others
+        df['metadata'] = df['metadata'].astype(object)
+        df.loc[fill_rows, 'metadata'] = pd.Series([{} for _ in range(fill_rows.sum())], index=df.index[fill_rows])
+
+    return df
+
+
 # =============================================================================
 # Test Assertions
 # =============================================================================
@@ -179,9 +1225,12 @@ def assert_no_nulls(df: pd.DataFrame, columns: list[str]) -> None:
         assert null_count == 0, f"Column {col} has {null_count} null values"
 
 
-def assert_unique(df: pd.DataFrame, columns: list[str]) -> None:
+def assert_unique(df: pd.DataFrame, columns: list[str], engine: str = 'pandas') -> None:
     """Assert no duplicate values in column combination."""
-    dup_count = df.duplicated(subset=columns).sum()
+    if engine == 'partitioned':
+        dup_count = find_duplicates(df, columns).duplicate_count
+    else:
+        dup_count = df.duplicated(subset=columns).sum()
     assert dup_count == 0, f"Found {dup_count} duplicate rows for columns {columns}"
 
 